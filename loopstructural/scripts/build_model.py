@@ -123,21 +123,34 @@ def export_surfaces(
     output_path: str,
     feature_name: str = None,
     isovalues: list = None,
+    nsteps: list = None,
 ) -> list:
     """
     Export model surfaces to VTK files.
 
+    Each feature's scalar field is evaluated once on a regular grid and all
+    isovalues are contoured from that cached volume. Falls back to
+    per-isovalue feature.isosurface() when PyVista is not installed.
+
     Args:
         model: Built GeologicalModel
         output_path: Output file path (without extension)
         feature_name: Specific feature to export (default: all)
         isovalues: List of isovalues to extract (default: [0])
+        nsteps: Evaluation grid resolution [nx, ny, nz] (default: 100^3)
 
     Returns:
         List of created file paths
     """
     if isovalues is None:
         isovalues = [0]
+    if nsteps is None:
+        nsteps = [100, 100, 100]
+
+    try:
+        import pyvista as pv
+    except ImportError:
+        pv = None
 
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -146,11 +159,31 @@ def export_surfaces(
 
     features = [feature_name] if feature_name else list(model.feature_name_index.keys())
 
+    vol = None
+    if pv is not None:
+        origin = np.asarray(model.origin, dtype=float)
+        maximum = np.asarray(model.maximum, dtype=float)
+        spacing = (maximum - origin) / (np.asarray(nsteps) - 1)
+        vol = pv.ImageData(dimensions=nsteps, origin=origin, spacing=spacing)
+
     for fname in features:
-        feature = model[fname]
+        if vol is not None:
+            try:
+                vol.point_data["field"] = model.evaluate_feature_value(
+                    fname, vol.points
+                )
+            except Exception as e:
+                print(f"Warning: Could not evaluate {fname}: {e}")
+                continue
+
         for isovalue in isovalues:
             try:
-                surface = feature.isosurface(isovalue=isovalue)
+                if vol is not None:
+                    surface = vol.contour(
+                        [isovalue], scalars="field", method="flying_edges"
+                    )
+                else:
+                    surface = model[fname].isosurface(isovalue=isovalue)
                 filepath = f"{output_path}_{fname}_iso{isovalue}.vtk"
                 surface.save(filepath)
                 created_files.append(filepath)
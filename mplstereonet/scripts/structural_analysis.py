@@ -15,6 +15,7 @@ Input CSV format:
 
 import argparse
 import sys
+from contextlib import contextmanager
 from pathlib import Path
 
 import matplotlib.pyplot as plt
@@ -22,6 +23,30 @@ import mplstereonet
 import numpy as np
 import pandas as pd
 
+# Density contours are O(n_data x n_grid); larger inputs are subsampled by
+# default (--max-contour-points)
+MAX_CONTOUR_POINTS = 2000
+
+# Shared (fig, ax) while inside reuse_figure(); None means one figure per call
+_FIG_CACHE = None
+
+
+@contextmanager
+def reuse_figure():
+    """
+    Reuse one stereonet figure across plot_stereonet calls.
+
+    Batch callers wrap their loop in this to avoid rebuilding the stereonet
+    projection for every plot; single-shot use keeps close-on-exit behavior.
+    """
+    global _FIG_CACHE
+    _FIG_CACHE = mplstereonet.subplots(figsize=(10, 10))
+    try:
+        yield _FIG_CACHE
+    finally:
+        plt.close(_FIG_CACHE[0])
+        _FIG_CACHE = None
+
 
 def load_data(filepath: str) -> pd.DataFrame:
     """
@@ -41,6 +66,22 @@ def load_data(filepath: str) -> pd.DataFrame:
     return df
 
 
+def _group_indices(labels: np.ndarray):
+    """
+    Bucket row indices by label without pandas groupby.
+
+    Yields:
+        (name, idx) pairs in sorted label order, skipping missing labels
+    """
+    valid = np.flatnonzero(pd.notna(labels))
+    uniq, inv = np.unique(labels[valid], return_inverse=True)
+    order = np.argsort(inv, kind="stable")
+    splits = np.searchsorted(inv[order], np.arange(len(uniq) + 1))
+
+    for k, name in enumerate(uniq):
+        yield name, valid[order[splits[k] : splits[k + 1]]]
+
+
 def calculate_statistics(strikes: np.ndarray, dips: np.ndarray) -> dict:
     """
     Calculate statistical measures for orientation data.
@@ -96,6 +137,7 @@ def plot_stereonet(
     show_planes: bool = False,
     show_stats: bool = False,
     title: str = None,
+    max_contour_points: int = MAX_CONTOUR_POINTS,
 ) -> None:
     """
     Create stereonet plot from structural data.
@@ -107,19 +149,28 @@ def plot_stereonet(
         show_planes: Plot great circles instead of just poles
         show_stats: Calculate and display statistics
         title: Plot title
+        max_contour_points: Poles beyond this are randomly subsampled for
+            the density contours (0 for no limit)
     """
-    fig, ax = mplstereonet.subplots(figsize=(10, 10))
+    if _FIG_CACHE is not None:
+        fig, ax = _FIG_CACHE
+    else:
+        fig, ax = mplstereonet.subplots(figsize=(10, 10))
+    # A colorbar takes its space from ax; restored for the next reuse
+    position = ax.get_position()
 
     # Check if we have multiple types/sets
     if "type" in df.columns or "set" in df.columns:
         type_col = "type" if "type" in df.columns else "set"
-        groups = df.groupby(type_col)
+        strikes_all = df["strike"].to_numpy()
+        dips_all = df["dip"].to_numpy()
+        groups = list(_group_indices(df[type_col].to_numpy()))
 
         colors = plt.cm.tab10(np.linspace(0, 1, len(groups)))
 
-        for (name, group), color in zip(groups, colors):
-            strikes = group["strike"].values
-            dips = group["dip"].values
+        for (name, idx), color in zip(groups, colors):
+            strikes = strikes_all[idx]
+            dips = dips_all[idx]
 
             if show_planes:
                 for s, d in zip(strikes, dips):
@@ -146,8 +197,20 @@ def plot_stereonet(
         dips = df["dip"].values
 
         if show_contours:
+            c_strikes, c_dips = strikes, dips
+            if max_contour_points and len(strikes) > max_contour_points:
+                # Kamb sigma levels depend on n, so say so when it changes
+                print(
+                    f"Note: density contours use a random subsample of "
+                    f"{max_contour_points} of {len(strikes)} poles "
+                    f"(--max-contour-points 0 to use all)"
+                )
+                rng = np.random.default_rng(0)
+                idx = rng.choice(len(strikes), max_contour_points, replace=False)
+                c_strikes, c_dips = strikes[idx], dips[idx]
+
             cax = ax.density_contourf(
-                strikes, dips, measurement="poles", cmap="Reds", alpha=0.7
+                c_strikes, c_dips, measurement="poles", cmap="Reds", alpha=0.7
             )
             fig.colorbar(cax, ax=ax, shrink=0.7, label="Density")
 
@@ -196,12 +259,21 @@ def plot_stereonet(
         ax.set_title(f"Structural Data (n={len(df)})", fontsize=12)
 
     if output_path:
-        plt.savefig(output_path, dpi=300, bbox_inches="tight")
+        fig.savefig(output_path, dpi=300, bbox_inches="tight")
         print(f"Saved: {output_path}")
     else:
         plt.show()
 
-    plt.close()
+    if _FIG_CACHE is not None:
+        # Drop colorbar axes, give ax back its full extent and clear it for
+        # the next call
+        for extra in fig.axes:
+            if extra is not ax:
+                extra.remove()
+        ax.set_position(position)
+        ax.cla()
+    else:
+        plt.close(fig)
 
 
 def print_statistics(df: pd.DataFrame) -> None:
@@ -212,11 +284,12 @@ def print_statistics(df: pd.DataFrame) -> None:
 
     if "type" in df.columns or "set" in df.columns:
         type_col = "type" if "type" in df.columns else "set"
-        groups = df.groupby(type_col)
+        strikes_all = df["strike"].to_numpy()
+        dips_all = df["dip"].to_numpy()
 
-        for name, group in groups:
-            strikes = group["strike"].values
-            dips = group["dip"].values
+        for name, idx in _group_indices(df[type_col].to_numpy()):
+            strikes = strikes_all[idx]
+            dips = dips_all[idx]
             stats = calculate_statistics(strikes, dips)
 
             print(f"\n{name.upper()}")
@@ -265,6 +338,11 @@ def main():
         "-s", "--stats", action="store_true", help="Calculate and show statistics"
     )
     parser.add_argument("-t", "--title", help="Plot title")
+    parser.add_argument(
+        "--max-contour-points", type=int, default=MAX_CONTOUR_POINTS,
+        help=f"Subsample poles for density contours above this count; "
+        f"0 uses all (default: {MAX_CONTOUR_POINTS})",
+    )
 
     args = parser.parse_args()
 
@@ -293,6 +371,7 @@ def main():
         show_planes=args.planes,
         show_stats=args.stats,
         title=args.title,
+        max_contour_points=args.max_contour_points,
     )
 
 
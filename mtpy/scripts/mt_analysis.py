@@ -7,16 +7,45 @@ Usage:
     python mt_analysis.py <directory> --recursive
     python mt_analysis.py <file.edi> --plot
     python mt_analysis.py <file.edi> --export csv
+    python mt_analysis.py <directory> --export parquet
 """
 
 import argparse
 import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import numpy as np
 import pandas as pd
 
 
+def extract_components(mt) -> dict:
+    """
+    Copy the off-diagonal tensor components into contiguous 1D arrays.
+
+    Slices like ``mt.Z[:, 0, 1]`` are strided views; copying them once up
+    front keeps every downstream reduction on unit-stride memory.
+
+    Returns:
+        dict with keys: z_xy, z_yx, z_err_xy, z_err_yx, rho_xy, rho_yx,
+        phase_xy, phase_yx
+    """
+    Z, Z_err = mt.Z, mt.Z_err
+    rho, phase = mt.apparent_resistivity, mt.phase
+
+    return {
+        "z_xy": np.ascontiguousarray(Z[:, 0, 1]),
+        "z_yx": np.ascontiguousarray(Z[:, 1, 0]),
+        "z_err_xy": np.ascontiguousarray(Z_err[:, 0, 1]),
+        "z_err_yx": np.ascontiguousarray(Z_err[:, 1, 0]),
+        "rho_xy": np.ascontiguousarray(rho[:, 0, 1]),
+        "rho_yx": np.ascontiguousarray(rho[:, 1, 0]),
+        "phase_xy": np.ascontiguousarray(phase[:, 0, 1]),
+        "phase_yx": np.ascontiguousarray(phase[:, 1, 0]),
+    }
+
+
 def analyze_mt(filepath: str, plot: bool = False) -> dict:
     """
     Analyze MT data from an EDI file and return a report.
@@ -72,12 +101,12 @@ def analyze_mt(filepath: str, plot: bool = False) -> dict:
 
     # Check impedance quality
     Z = mt.Z
-    Z_err = mt.Z_err
+    comp = extract_components(mt)
 
     # Calculate relative errors
     with np.errstate(divide="ignore", invalid="ignore"):
-        rel_err_xy = np.abs(Z_err[:, 0, 1]) / np.abs(Z[:, 0, 1])
-        rel_err_yx = np.abs(Z_err[:, 1, 0]) / np.abs(Z[:, 1, 0])
+        rel_err_xy = np.abs(comp["z_err_xy"]) / np.abs(comp["z_xy"])
+        rel_err_yx = np.abs(comp["z_err_yx"]) / np.abs(comp["z_yx"])
 
     # Count bad data points (relative error > 50%)
     bad_xy = np.sum(rel_err_xy > 0.5)
@@ -122,8 +151,8 @@ def analyze_mt(filepath: str, plot: bool = False) -> dict:
         report["warnings"].append("Could not compute phase tensor")
 
     # Apparent resistivity range check
-    rho_xy = mt.apparent_resistivity[:, 0, 1]
-    rho_yx = mt.apparent_resistivity[:, 1, 0]
+    rho_xy = comp["rho_xy"]
+    rho_yx = comp["rho_yx"]
 
     valid_rho = rho_xy[(rho_xy > 0) & np.isfinite(rho_xy)]
     if len(valid_rho) > 0:
@@ -141,8 +170,8 @@ def analyze_mt(filepath: str, plot: bool = False) -> dict:
     report["data"]["frequency"] = mt.frequency
     report["data"]["apparent_resistivity_xy"] = rho_xy
     report["data"]["apparent_resistivity_yx"] = rho_yx
-    report["data"]["phase_xy"] = mt.phase[:, 0, 1]
-    report["data"]["phase_yx"] = mt.phase[:, 1, 0]
+    report["data"]["phase_xy"] = comp["phase_xy"]
+    report["data"]["phase_yx"] = comp["phase_yx"]
 
     # Generate plots if requested
     if plot:
@@ -166,7 +195,7 @@ def export_data(filepath: str, format: str = "csv") -> str:
 
     Args:
         filepath: Path to EDI file
-        format: Output format ('csv', 'excel')
+        format: Output format ('csv', 'parquet', 'excel')
 
     Returns:
         Path to exported file
@@ -174,38 +203,90 @@ def export_data(filepath: str, format: str = "csv") -> str:
     from mtpy import MT
 
     mt = MT(filepath)
-
-    df = pd.DataFrame(
-        {
-            "frequency_hz": mt.frequency,
-            "period_s": 1 / mt.frequency,
-            "rho_xy_ohm_m": mt.apparent_resistivity[:, 0, 1],
-            "rho_yx_ohm_m": mt.apparent_resistivity[:, 1, 0],
-            "phase_xy_deg": mt.phase[:, 0, 1],
-            "phase_yx_deg": mt.phase[:, 1, 0],
-            "z_xy_real": mt.Z[:, 0, 1].real,
-            "z_xy_imag": mt.Z[:, 0, 1].imag,
-            "z_yx_real": mt.Z[:, 1, 0].real,
-            "z_yx_imag": mt.Z[:, 1, 0].imag,
-            "z_xy_err": mt.Z_err[:, 0, 1],
-            "z_yx_err": mt.Z_err[:, 1, 0],
-        }
-    )
+    comp = extract_components(mt)
+
+    # Interleaved (real, imag) pairs as zero-copy float views
+    z_xy = comp["z_xy"].astype(np.complex128, copy=False).view(np.float64)
+    z_yx = comp["z_yx"].astype(np.complex128, copy=False).view(np.float64)
+    z_xy = z_xy.reshape(-1, 2)
+    z_yx = z_yx.reshape(-1, 2)
+
+    columns = {
+        "frequency_hz": mt.frequency,
+        "period_s": 1 / mt.frequency,
+        "rho_xy_ohm_m": comp["rho_xy"],
+        "rho_yx_ohm_m": comp["rho_yx"],
+        "phase_xy_deg": comp["phase_xy"],
+        "phase_yx_deg": comp["phase_yx"],
+        "z_xy_real": z_xy[:, 0],
+        "z_xy_imag": z_xy[:, 1],
+        "z_yx_real": z_yx[:, 0],
+        "z_yx_imag": z_yx[:, 1],
+        "z_xy_err": comp["z_err_xy"],
+        "z_yx_err": comp["z_err_yx"],
+    }
 
     stem = Path(filepath).stem
 
     if format == "csv":
         output_path = f"{stem}_data.csv"
-        df.to_csv(output_path, index=False)
+        pd.DataFrame(columns).to_csv(output_path, index=False)
+    elif format == "parquet":
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("pyarrow required for parquet export: pip install pyarrow")
+        output_path = f"{stem}_data.parquet"
+        pq.write_table(pa.table(columns), output_path, compression="zstd")
     elif format == "excel":
         output_path = f"{stem}_data.xlsx"
-        df.to_excel(output_path, index=False, sheet_name="MT_Data")
+        pd.DataFrame(columns).to_excel(output_path, index=False, sheet_name="MT_Data")
     else:
         raise ValueError(f"Unknown format: {format}")
 
     return output_path
 
 
+def _read_ahead(filepath: str) -> int:
+    """Read a file's bytes so the OS page cache is warm for the parser."""
+    with open(filepath, "rb") as f:
+        return len(f.read())
+
+
+def prefetch_files(files: list, workers: int = 4):
+    """
+    Yield files in order while reading ahead in a thread pool.
+
+    MT() only accepts a path, so the read-ahead cannot hand over buffers;
+    it overlaps disk I/O for upcoming files with parsing of the current one.
+
+    Args:
+        files: Paths to iterate over
+        workers: Number of read-ahead threads (window is 2x this)
+    """
+    window = max(1, workers * 2)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        remaining = iter(files)
+
+        for filepath in remaining:
+            pending.append((filepath, executor.submit(_read_ahead, str(filepath))))
+            if len(pending) >= window:
+                break
+
+        while pending:
+            filepath, future = pending.popleft()
+            try:
+                future.result()
+            except OSError:
+                pass  # Let the MT reader report the error
+            nxt = next(remaining, None)
+            if nxt is not None:
+                pending.append((nxt, executor.submit(_read_ahead, str(nxt))))
+            yield filepath
+
+
 def print_report(filepath: str, report: dict) -> None:
     """Print analysis report."""
     status = "VALID" if report["valid"] else "INVALID"
@@ -246,7 +327,7 @@ def main():
     parser.add_argument(
         "-e",
         "--export",
-        choices=["csv", "excel"],
+        choices=["csv", "parquet", "excel"],
         help="Export data to specified format",
     )
     args = parser.parse_args()
@@ -271,7 +352,7 @@ def main():
         sys.exit(1)
 
     valid_count = 0
-    for filepath in sorted(files):
+    for filepath in prefetch_files(sorted(files)):
         report = analyze_mt(str(filepath), plot=args.plot)
         print_report(str(filepath), report)
         if report["valid"]:
@@ -9,12 +9,148 @@ Usage:
 """
 
 import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
 
+import numpy as np
 from obspy import UTCDateTime
 from obspy.clients.fdsn import Client
 from obspy.clients.fdsn.header import FDSNNoDataException
-from obspy.geodetics import locations2degrees
+
+# FDSN data centres throttle clients beyond a handful of connections
+MAX_DOWNLOAD_WORKERS = 8
+
+
+# Distance step of the interpolated P travel-time grid, in degrees
+P_GRID_STEP = 0.5
+
+
+@lru_cache(maxsize=4)
+def _taup_model(model: str):
+    """TauP model, loaded once per name."""
+    from obspy.taup import TauPyModel
+
+    return TauPyModel(model=model)
+
+
+def p_travel_times(distance_deg, depth_km: float, model: str = "iasp91") -> np.ndarray:
+    """First-arriving P travel times from one TauP ray trace per distance."""
+    taup = _taup_model(model)
+    distances = np.asarray(distance_deg, dtype=np.float64)
+    times = np.empty_like(distances)
+    for i, d in enumerate(distances.flat):
+        arrivals = taup.get_travel_times(
+            source_depth_in_km=depth_km, distance_in_degree=d, phase_list=["ttp"]
+        )
+        # Fall back to ~10 s/deg where no P-type phase exists
+        times.flat[i] = min(a.time for a in arrivals) if arrivals else d * 10
+    return times
+
+
+@lru_cache(maxsize=16)
+def p_travel_time_table(
+    depth_km: float, d_min: float, d_max: float, model: str = "iasp91"
+) -> tuple:
+    """
+    First-arriving P travel times on a P_GRID_STEP distance grid.
+
+    Built once per (depth, distance span, model) so each station costs one
+    np.interp instead of a TauP ray trace.
+
+    Returns:
+        (distance_deg, travel_time_s) arrays
+    """
+    dist_grid = np.arange(d_min, d_max + P_GRID_STEP / 2, P_GRID_STEP)
+    return dist_grid, p_travel_times(dist_grid, depth_km, model)
+
+
+def p_arrival_offset(distance_deg, depth_km: float = 10.0) -> np.ndarray:
+    """
+    P travel time(s) in seconds, depth rounded to the nearest km.
+
+    Stations are traced directly unless they outnumber the points of a
+    grid spanning their distances, which is then interpolated instead.
+    """
+    distances = np.asarray(distance_deg, dtype=np.float64)
+    depth_km = float(round(max(depth_km, 0.0)))
+    if distances.size == 0:
+        return distances.copy()
+
+    d_min = float(np.floor(distances.min() / P_GRID_STEP) * P_GRID_STEP)
+    d_max = float(np.ceil(distances.max() / P_GRID_STEP) * P_GRID_STEP)
+    if distances.size <= round((d_max - d_min) / P_GRID_STEP) + 1:
+        return p_travel_times(distances, depth_km)
+
+    dist_grid, times = p_travel_time_table(depth_km, d_min, d_max)
+    return np.interp(distances, dist_grid, times)
+
+
+def haversine_deg(lat0: float, lon0: float, lats, lons) -> np.ndarray:
+    """Great-circle distances in degrees from one point to arrays of points."""
+    lat0, lon0 = np.radians(lat0), np.radians(lon0)
+    lats, lons = np.radians(lats), np.radians(lons)
+    a = (
+        np.sin((lats - lat0) / 2) ** 2
+        + np.cos(lat0) * np.cos(lats) * np.sin((lons - lon0) / 2) ** 2
+    )
+    return np.degrees(2 * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0))))
+
+
+def station_coordinates(inv) -> dict:
+    """
+    Map (network, station) to (latitude, longitude) for a station inventory.
+
+    Stations are also keyed under network "*" so wildcard requests resolve.
+    """
+    coords = {}
+    for net in inv:
+        for sta in net:
+            coords[(net.code, sta.code)] = (sta.latitude, sta.longitude)
+            coords.setdefault(("*", sta.code), (sta.latitude, sta.longitude))
+    return coords
+
+
+def _fetch_one(
+    client: Client,
+    network: str,
+    station: str,
+    channels: str,
+    starttime: UTCDateTime,
+    endtime: UTCDateTime,
+    filepath: Path,
+    retries: int = 2,
+) -> tuple:
+    """
+    Download and save one station's waveforms.
+
+    Transient errors are retried with exponential backoff; missing data is
+    reported immediately.
+
+    Returns:
+        (status, filepath or None, error message or None)
+    """
+    for attempt in range(retries + 1):
+        try:
+            st = client.get_waveforms(
+                network=network,
+                station=station,
+                location="*",
+                channel=channels,
+                starttime=starttime,
+                endtime=endtime,
+            )
+            if len(st) == 0:
+                return "nodata", None, None
+            st.write(str(filepath), format="MSEED")
+            return "saved", str(filepath), None
+        except FDSNNoDataException:
+            return "nodata", None, None
+        except Exception as e:
+            if attempt == retries:
+                return "error", None, str(e)
+            time.sleep(2**attempt)
 
 
 def fetch_earthquake_waveforms(
@@ -23,6 +159,7 @@ def fetch_earthquake_waveforms(
     longitude: float = None,
     origin_time: str = None,
     magnitude: float = None,
+    depth: float = 10.0,
     stations: list = None,
     networks: str = "IU,II",
     channels: str = "BHZ",
@@ -32,6 +169,7 @@ def fetch_earthquake_waveforms(
     after_p: float = 600.0,
     output_dir: str = ".",
     client_name: str = "IRIS",
+    workers: int = MAX_DOWNLOAD_WORKERS,
 ) -> list:
     """
     Fetch waveforms for an earthquake.
@@ -42,6 +180,7 @@ def fetch_earthquake_waveforms(
         longitude: Event longitude (if no event_id)
         origin_time: Event origin time (if no event_id)
         magnitude: Event magnitude for filename (if no event_id)
+        depth: Event depth in km for travel times (if no event_id)
         stations: List of specific stations (e.g., ['IU.ANMO', 'IU.HRV'])
         networks: Comma-separated network codes
         channels: Comma-separated channel codes
@@ -51,6 +190,7 @@ def fetch_earthquake_waveforms(
         after_p: Seconds after P arrival to fetch
         output_dir: Directory for output files
         client_name: FDSN client name
+        workers: Concurrent downloads (capped at MAX_DOWNLOAD_WORKERS)
 
     Returns:
         List of output file paths
@@ -71,6 +211,8 @@ def fetch_earthquake_waveforms(
         longitude = origin.longitude
         origin_time = origin.time
         magnitude = event.magnitudes[0].mag if event.magnitudes else 0.0
+        if origin.depth is not None:
+            depth = origin.depth / 1000.0
         print(f"Event: M{magnitude:.1f} at {latitude:.2f}, {longitude:.2f}")
         print(f"Time: {origin_time}")
     else:
@@ -87,6 +229,36 @@ def fetch_earthquake_waveforms(
                 station_list.append((parts[0], parts[1]))
             else:
                 station_list.append(("*", parts[0]))
+
+        # One bulk metadata request for exactly the requested (network,
+        # station) pairs; comma lists would ask for their cross product
+        try:
+            inv = waveform_client.get_stations_bulk(
+                [
+                    (network, station, "*", "*", origin_time, origin_time + 1)
+                    for network, station in station_list
+                ],
+                level="station",
+            )
+            coords = station_coordinates(inv)
+        except FDSNNoDataException:
+            coords = {}
+        except Exception as e:
+            # One bad code fails the whole bulk request; ask station by
+            # station so the rest still resolve
+            print(f"Bulk station request failed ({e}), requesting stations one by one")
+            coords = {}
+            for network, station in station_list:
+                try:
+                    inv = waveform_client.get_stations(
+                        network=network,
+                        station=station,
+                        starttime=origin_time,
+                        level="station",
+                    )
+                except Exception:
+                    continue
+                coords.update(station_coordinates(inv))
     else:
         print(f"Searching for stations {min_radius}-{max_radius} degrees away...")
         inv = waveform_client.get_stations(
@@ -105,59 +277,69 @@ def fetch_earthquake_waveforms(
             for net in inv
             for sta in net
         ]
+        coords = station_coordinates(inv)
         print(f"Found {len(station_list)} stations")
 
-    # Fetch waveforms for each station
+    # Build request windows for each station
+    mag_str = f"M{magnitude:.1f}" if magnitude else "Munk"
+    requests = []
+    located = []
     for network, station in station_list:
-        try:
-            # Calculate approximate P arrival time using distance
-            inv = waveform_client.get_stations(
-                network=network,
-                station=station,
-                starttime=origin_time,
-                level="station",
-            )
-            if not inv or not inv[0]:
-                print(f"  {network}.{station}: No station metadata")
-                continue
-
-            sta_lat = inv[0][0].latitude
-            sta_lon = inv[0][0].longitude
-            distance_deg = locations2degrees(latitude, longitude, sta_lat, sta_lon)
-
-            # Approximate P travel time (very rough: 10 deg ~= 100s)
-            approx_p_time = origin_time + distance_deg * 10
+        if (network, station) not in coords:
+            print(f"  {network}.{station}: No station metadata")
+        else:
+            located.append((network, station))
 
-            t1 = approx_p_time - before_p
-            t2 = approx_p_time + after_p
+    # Distances and P offsets (seconds after origin) for all stations at once
+    lat_lon = np.array([coords[key] for key in located], dtype=np.float64)
+    lat_lon = lat_lon.reshape(-1, 2)
+    distances = haversine_deg(latitude, longitude, lat_lon[:, 0], lat_lon[:, 1])
+    p_offsets = p_arrival_offset(distances, depth)
 
-            print(f"  Fetching {network}.{station} (dist={distance_deg:.1f} deg)...")
-
-            st = waveform_client.get_waveforms(
-                network=network,
-                station=station,
-                location="*",
-                channel=channels,
-                starttime=t1,
-                endtime=t2,
+    for (network, station), distance_deg, p_offset in zip(
+        located, distances.tolist(), p_offsets.tolist()
+    ):
+        filename = f"{event_id or 'event'}_{mag_str}_{network}.{station}.mseed"
+        requests.append(
+            (
+                network,
+                station,
+                distance_deg,
+                p_offset - before_p,
+                p_offset + after_p,
+                output_path / filename,
             )
+        )
 
-            if len(st) == 0:
-                print(f"    No data available")
-                continue
-
-            # Save to file
-            mag_str = f"M{magnitude:.1f}" if magnitude else "Munk"
-            filename = f"{event_id or 'event'}_{mag_str}_{network}.{station}.mseed"
-            filepath = output_path / filename
-            st.write(str(filepath), format="MSEED")
-            output_files.append(str(filepath))
-            print(f"    Saved: {filepath}")
+    # Download concurrently; client objects and sockets stay in-process
+    n_workers = max(1, min(workers, MAX_DOWNLOAD_WORKERS))
+    print(f"Fetching {len(requests)} stations with {n_workers} threads...")
+    with ThreadPoolExecutor(max_workers=n_workers) as executor:
+        futures = {
+            executor.submit(
+                _fetch_one,
+                waveform_client,
+                net,
+                sta,
+                channels,
+                origin_time + off1,
+                origin_time + off2,
+                fpath,
+            ): (net, sta, dist)
+            for net, sta, dist, off1, off2, fpath in requests
+        }
 
-        except FDSNNoDataException:
-            print(f"    No data available")
-        except Exception as e:
-            print(f"    Error: {e}")
+        for future in as_completed(futures):
+            network, station, distance_deg = futures[future]
+            status, filepath, error = future.result()
+            label = f"  {network}.{station} (dist={distance_deg:.1f} deg)"
+            if status == "saved":
+                output_files.append(filepath)
+                print(f"{label}: Saved {filepath}")
+            elif status == "nodata":
+                print(f"{label}: No data available")
+            else:
+                print(f"{label}: Error: {error}")
 
     print(f"\nDownloaded {len(output_files)} files to {output_path}")
     return output_files
@@ -177,6 +359,9 @@ def main():
     event_group.add_argument("--lon", type=float, help="Event longitude")
     event_group.add_argument("--time", "-t", help="Origin time (ISO format)")
     event_group.add_argument("--mag", type=float, help="Magnitude (for filename)")
+    event_group.add_argument(
+        "--depth", type=float, default=10.0, help="Event depth in km (default: 10)"
+    )
 
     # Station selection
     station_group = parser.add_argument_group("Station selection")
@@ -212,6 +397,10 @@ def main():
     parser.add_argument(
         "--client", default="IRIS", help="FDSN client (default: IRIS)"
     )
+    parser.add_argument(
+        "--workers", "-w", type=int, default=MAX_DOWNLOAD_WORKERS,
+        help=f"Concurrent downloads (default/max: {MAX_DOWNLOAD_WORKERS})"
+    )
 
     args = parser.parse_args()
 
@@ -227,6 +416,7 @@ def main():
         longitude=args.lon,
         origin_time=args.time,
         magnitude=args.mag,
+        depth=args.depth,
         stations=stations,
         networks=args.networks,
         channels=args.channels,
@@ -236,6 +426,7 @@ def main():
         after_p=args.after_p,
         output_dir=args.output,
         client_name=args.client,
+        workers=args.workers,
     )
 
 
@@ -10,6 +10,9 @@ Usage:
 
 import argparse
 import json
+import os
+import re
+import tempfile
 from pathlib import Path
 
 import numpy as np
@@ -20,6 +23,23 @@ except ImportError:
     print("Error: petropy not installed. Run: pip install petropy")
     exit(1)
 
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+    prange = range
+
+
+# lasio parses the ~A section in one StringIO/loadtxt call; stream above this
+LARGE_LAS_BYTES = 500 * 1024 * 1024
+
+# Data-section rows parsed per pandas chunk in the streaming reader
+LAS_CHUNK_ROWS = 1_000_000
 
 DEFAULT_PARAMS = {
     # Shale volume parameters
@@ -63,23 +83,333 @@ def load_params(config_file: str = None) -> dict:
 
 def check_curves(log, required: list) -> list:
     """Check which required curves are available."""
-    available = list(log.keys())
+    available = set(log.keys())
     missing = [c for c in required if c not in available]
     return missing
 
 
-def formation_evaluation(las_path: str, params: dict) -> pp.Log:
+def _log_step(depth, log=None) -> float:
+    """
+    Depth sampling interval of a log.
+
+    Uses the LAS header STEP when present, otherwise the first interval if
+    the leading samples are regular; only irregular logs pay for the
+    median of all differences.
+    """
+    if log is not None:
+        try:
+            step = abs(float(log.well['STEP'].value))
+            if step > 0:
+                return step
+        except (KeyError, AttributeError, TypeError, ValueError):
+            pass
+
+    depth = np.asarray(depth)
+    if len(depth) < 2:
+        return 0.0
+    step = abs(depth[1] - depth[0])
+    head = depth[:min(len(depth), 64)]
+    if step > 0 and np.allclose(np.abs(np.diff(head)), step):
+        return float(step)
+    return float(np.median(np.abs(np.diff(depth))))
+
+
+# fastmath without 'nnan'/'ninf' so LAS null samples (NaN) propagate
+_FASTMATH = {'nsz', 'arcp', 'contract', 'afn', 'reassoc'}
+_JIT = dict(parallel=True, fastmath=_FASTMATH, error_model='numpy', cache=True)
+
+
+@njit(**_JIT)
+def _vsh_linear(gr, gr_clean, gr_shale, out):
+    """Linear gamma-ray shale volume, clipped to [0, 1]."""
+    scale = 1.0 / (gr_shale - gr_clean)
+    for i in prange(gr.shape[0]):
+        v = (gr[i] - gr_clean) * scale
+        if v < 0.0:
+            v = 0.0
+        elif v > 1.0:
+            v = 1.0
+        out[i] = v
+    return out
+
+
+@njit(**_JIT)
+def _phid(rhob, vsh, rhob_matrix, rhob_fluid, rhob_shale, out):
+    """Density porosity with optional shale correction, clipped to [0, 1]."""
+    scale = 1.0 / (rhob_matrix - rhob_fluid)
+    shale = (rhob_matrix - rhob_shale) * scale
+    has_vsh = vsh.shape[0] > 0
+    for i in prange(rhob.shape[0]):
+        phi = (rhob_matrix - rhob[i]) * scale
+        if has_vsh:
+            phi -= vsh[i] * shale
+        if phi < 0.0:
+            phi = 0.0
+        elif phi > 1.0:
+            phi = 1.0
+        out[i] = phi
+    return out
+
+
+@njit(**_JIT)
+def _archie(phi, rt, rw, a, m, n, out):
+    """Archie water saturation, capped at 1."""
+    inv_n = 1.0 / n
+    for i in prange(phi.shape[0]):
+        sw = (a * rw / (phi[i] ** m * rt[i])) ** inv_n
+        out[i] = 1.0 if sw > 1.0 else sw
+    return out
+
+
+@njit(**_JIT)
+def _timur(phi, sw, out):
+    """Timur permeability in mD from fractional porosity and saturation."""
+    for i in prange(phi.shape[0]):
+        out[i] = 8581.0 * phi[i] ** 4.4 / (sw[i] * sw[i])
+    return out
+
+
+@njit(**_JIT)
+def _petro_fuse(gr, rhob, rt, p, vsh_out, phit_out, sw_out, perm_out, pay_out):
+    """
+    Vsh, porosity, Archie Sw, Timur perm and pay flag in one pass.
+
+    p holds (gr_clean, gr_shale, rhob_matrix, rhob_fluid, rhob_shale,
+    rw, a, m, n, vsh_cutoff, phi_cutoff, sw_cutoff).
+    """
+    gr_scale = 1.0 / (p[1] - p[0])
+    rho_scale = 1.0 / (p[2] - p[3])
+    shale = (p[2] - p[4]) * rho_scale
+    arw = p[6] * p[5]
+    inv_n = 1.0 / p[8]
+    for i in prange(gr.shape[0]):
+        vsh = (gr[i] - p[0]) * gr_scale
+        if vsh < 0.0:
+            vsh = 0.0
+        elif vsh > 1.0:
+            vsh = 1.0
+
+        phi = (p[2] - rhob[i]) * rho_scale - vsh * shale
+        if phi < 0.0:
+            phi = 0.0
+        elif phi > 1.0:
+            phi = 1.0
+
+        sw = (arw / (phi ** p[7] * rt[i])) ** inv_n
+        if sw > 1.0:
+            sw = 1.0
+
+        vsh_out[i] = vsh
+        phit_out[i] = phi
+        sw_out[i] = sw
+        perm_out[i] = 8581.0 * phi ** 4.4 / (sw * sw)
+        pay_out[i] = vsh < p[9] and phi > p[10] and sw < p[11]
+
+
+def _can_fuse(params: dict, curves: set) -> bool:
+    """Whether the single-pass kernel covers this configuration."""
+    return (
+        HAS_NUMBA
+        and params['vsh_method'] == 'linear'
+        and params['sw_method'] == 'archie'
+        and params['perm_method'] == 'timur'
+        and all(params[c] in curves for c in ('gr_curve', 'rhob_curve', 'rt_curve'))
+    )
+
+
+def _evaluate_fused(log, params: dict) -> np.ndarray:
+    """Write VSH, PHIT, SW and PERM to the log in one pass; return the pay mask."""
+    gr = _curve(log, params['gr_curve'])
+    p = np.array([params[k] for k in (
+        'gr_clean', 'gr_shale', 'rhob_matrix', 'rhob_fluid', 'rhob_shale',
+        'rw', 'a', 'm', 'n', 'vsh_cutoff', 'phi_cutoff', 'sw_cutoff',
+    )], dtype=np.float64)
+    out = {name: np.empty_like(gr) for name in ('VSH', 'PHIT', 'SW', 'PERM')}
+    pay = np.empty(gr.shape, dtype=bool)
+
+    _petro_fuse(
+        gr, _curve(log, params['rhob_curve']), _curve(log, params['rt_curve']), p,
+        out['VSH'], out['PHIT'], out['SW'], out['PERM'], pay
+    )
+
+    for name, values in out.items():
+        log[name] = values
+    print(f"  VSH range: {log['VSH'].min():.3f} - {log['VSH'].max():.3f}")
+    print(f"  PHIT range: {log['PHIT'].min():.3f} - {log['PHIT'].max():.3f}")
+    print(f"  SW range: {log['SW'].min():.3f} - {log['SW'].max():.3f}")
+    print(f"  PERM range: {log['PERM'].min():.3f} - {log['PERM'].max():.1f} mD")
+    return pay
+
+
+def _curve(log, name: str) -> np.ndarray:
+    """Curve values as a contiguous float32 array for the numba kernels."""
+    return np.ascontiguousarray(log[name], dtype=np.float32)
+
+
+def downcast_curves(log, keep: tuple = ()) -> None:
+    """
+    Store float64 curves as float32 in place.
+
+    Log values carry ~3 significant figures, so single precision halves
+    memory traffic in every later pass. Curves in keep (the depth index)
+    stay float64.
+    """
+    for curve in log.curves:
+        if curve.mnemonic not in keep and curve.data.dtype == np.float64:
+            curve.data = curve.data.astype(np.float32)
+
+
+def _data_section_start(las_path: str) -> tuple:
+    """
+    Locate the ~A section.
+
+    Returns:
+        (header lines before the first data row, data rows)
+    """
+    skip = None
+    n_rows = 0
+    with open(las_path, 'rb') as f:
+        for i, line in enumerate(f):
+            if line.lstrip().startswith(b'~A'):
+                skip = i + 1
+                break
+        if skip is None:
+            raise ValueError(f"No ~A data section in {las_path}")
+        for line in f:
+            stripped = line.strip()
+            if stripped and not stripped.startswith(b'#'):
+                n_rows += 1
+    return skip, n_rows
+
+
+def read_large_las(las_path: str) -> pp.Log:
+    """
+    Read a large LAS file without lasio's whole-section parse.
+
+    The header is parsed by lasio; the ~A section is streamed through the
+    pandas C parser in chunks into float32 memmaps (depth kept float64)
+    backed by a temporary file, then attached to the Log's curves.
+    """
+    import pandas as pd
+
+    log = pp.Log()
+    log.read(las_path, ignore_data=True)
+    if str(log.version['WRAP'].value).upper().startswith('Y'):
+        raise ValueError("Wrapped LAS files are not supported by the streaming reader")
+
+    skip, n_rows = _data_section_start(las_path)
+    n_curves = len(log.curves)
+    try:
+        null = float(log.well['NULL'].value)
+    except (KeyError, TypeError, ValueError):
+        null = None
+
+    scratch = tempfile.TemporaryFile()
+    dtypes = [np.float64] + [np.float32] * (n_curves - 1)
+    columns, offset = [], 0
+    for dtype in dtypes:
+        columns.append(np.memmap(scratch, dtype=dtype, mode='w+',
+                                 offset=offset, shape=(n_rows,)))
+        offset += n_rows * np.dtype(dtype).itemsize
+
+    row = 0
+    reader = pd.read_csv(
+        las_path, skiprows=skip, sep=r'\s+', header=None, comment='#',
+        names=range(n_curves), dtype=dict(enumerate(dtypes)),
+        engine='c', chunksize=LAS_CHUNK_ROWS,
+    )
+    for chunk in reader:
+        end = row + len(chunk)
+        for j, column in enumerate(columns):
+            values = chunk[j].to_numpy()
+            if null is not None:
+                values = np.where(values == values.dtype.type(null), np.nan, values)
+            column[row:end] = values
+        row = end
+
+    for curve, column in zip(log.curves, columns):
+        curve.data = column
+    # lasio records this on a normal read; the writer compares against it
+    log.index_initial = log.index.copy()
+    return log
+
+
+def _sidecar(las_path: str, mnemonic: str) -> Path:
+    """Path of the .npy cache for one curve of a LAS file."""
+    name = re.sub(r'\W', '_', mnemonic.lower())
+    return Path(las_path).with_suffix(f'.{name}.npy')
+
+
+def _load_cached(las_path: str):
+    """
+    Rebuild a Log from its header and memory-mapped curve sidecars.
+
+    Returns None unless every curve has a sidecar newer than the LAS file.
+    """
+    las_mtime = os.stat(las_path).st_mtime_ns
+    log = pp.Log()
+    log.read(las_path, ignore_data=True)
+    paths = [_sidecar(las_path, curve.mnemonic) for curve in log.curves]
+    if not paths or not all(
+        p.is_file() and p.stat().st_mtime_ns >= las_mtime for p in paths
+    ):
+        return None
+    for curve, path in zip(log.curves, paths):
+        curve.data = np.load(path, mmap_mode='r')
+    log.index_initial = log.index.copy()
+    return log
+
+
+def _save_cached(log, las_path: str) -> None:
+    """Write each curve of a freshly parsed log to its .npy sidecar."""
+    try:
+        for curve in log.curves:
+            np.save(_sidecar(las_path, curve.mnemonic), np.asarray(curve.data))
+    except OSError as e:
+        print(f"Warning: could not write curve cache: {e}")
+
+
+def load_log(las_path: str, params: dict, cache: bool = False) -> pp.Log:
+    """
+    Load a LAS file as float32 curves, via .npy sidecars when available.
+
+    With cache, the first run parses the LAS (streaming files over
+    LARGE_LAS_BYTES) and writes one sidecar per curve next to it; later
+    runs memory-map those read-only, so no text is parsed and pages load
+    on demand. Off by default, as it writes into the data directory.
+    """
+    if cache:
+        log = _load_cached(las_path)
+        if log is not None:
+            print(f"Using cached curves for {las_path}")
+            return log
+
+    if os.path.getsize(las_path) > LARGE_LAS_BYTES:
+        print(f"Streaming large LAS file ({os.path.getsize(las_path) / 2**20:.0f} MB)")
+        log = read_large_las(las_path)
+    else:
+        log = pp.Log(las_path)
+    downcast_curves(log, keep=(params['depth_curve'],))
+
+    if cache:
+        _save_cached(log, las_path)
+    return log
+
+
+def formation_evaluation(las_path: str, params: dict, cache: bool = False) -> pp.Log:
     """
     Perform complete formation evaluation.
 
     Args:
         las_path: Path to input LAS file
         params: Dictionary of evaluation parameters
+        cache: Read/write per-curve .npy sidecars next to the LAS file
 
     Returns:
         PetroPy Log object with calculated curves
     """
-    log = pp.Log(las_path)
+    log = load_log(las_path, params, cache=cache)
+    curves = set(log.keys())
     print(f"Loaded: {las_path}")
     print(f"Curves: {list(log.keys())}")
     print(f"Depth range: {log[params['depth_curve']].min():.1f} - "
@@ -91,74 +421,117 @@ def formation_evaluation(las_path: str, params: dict) -> pp.Log:
     if missing:
         print(f"Warning: Missing curves: {missing}")
 
-    # 1. Shale Volume
-    if params['gr_curve'] in log.keys():
-        print("\nCalculating shale volume...")
-        log.shale_volume(
-            gr_curve=params['gr_curve'],
-            gr_clean=params['gr_clean'],
-            gr_shale=params['gr_shale'],
-            method=params['vsh_method']
-        )
-        print(f"  VSH range: {log['VSH'].min():.3f} - {log['VSH'].max():.3f}")
-
-    # 2. Porosity
-    if params['rhob_curve'] in log.keys():
-        print("\nCalculating porosity...")
-        if 'VSH' in log.keys():
-            log.formation_porosity(
-                rhob_curve=params['rhob_curve'],
-                rhob_matrix=params['rhob_matrix'],
-                rhob_fluid=params['rhob_fluid'],
-                rhob_shale=params['rhob_shale'],
-                vsh_curve='VSH'
-            )
-        else:
-            log.formation_porosity(
-                rhob_curve=params['rhob_curve'],
-                rhob_matrix=params['rhob_matrix'],
-                rhob_fluid=params['rhob_fluid']
-            )
-        print(f"  PHIT range: {log['PHIT'].min():.3f} - {log['PHIT'].max():.3f}")
-
-    # 3. Water Saturation
-    if params['rt_curve'] in log.keys() and 'PHIT' in log.keys():
-        print("\nCalculating water saturation...")
-        log.water_saturation(
-            method=params['sw_method'],
-            rt_curve=params['rt_curve'],
-            porosity_curve='PHIT',
-            rw=params['rw'],
-            a=params['a'],
-            m=params['m'],
-            n=params['n']
-        )
-        print(f"  SW range: {log['SW'].min():.3f} - {log['SW'].max():.3f}")
-
-    # 4. Permeability
-    if 'PHIT' in log.keys() and 'SW' in log.keys():
-        print("\nCalculating permeability...")
-        log.permeability(
-            method=params['perm_method'],
-            porosity_curve='PHIT',
-            sw_curve='SW'
-        )
-        print(f"  PERM range: {log['PERM'].min():.3f} - {log['PERM'].max():.1f} mD")
+    pay = None
+    if _can_fuse(params, curves):
+        print("\nCalculating VSH, PHIT, SW, PERM and pay in one pass...")
+        pay = _evaluate_fused(log, params)
+        curves.update(('VSH', 'PHIT', 'SW', 'PERM'))
+    else:
+        # 1. Shale Volume
+        if params['gr_curve'] in curves:
+            print("\nCalculating shale volume...")
+            if HAS_NUMBA and params['vsh_method'] == 'linear':
+                gr = _curve(log, params['gr_curve'])
+                log['VSH'] = _vsh_linear(
+                    gr, params['gr_clean'], params['gr_shale'], np.empty_like(gr)
+                )
+            else:
+                log.shale_volume(
+                    gr_curve=params['gr_curve'],
+                    gr_clean=params['gr_clean'],
+                    gr_shale=params['gr_shale'],
+                    method=params['vsh_method']
+                )
+            curves.add('VSH')
+            print(f"  VSH range: {log['VSH'].min():.3f} - {log['VSH'].max():.3f}")
+
+        # 2. Porosity
+        if params['rhob_curve'] in curves:
+            print("\nCalculating porosity...")
+            if HAS_NUMBA:
+                rhob = _curve(log, params['rhob_curve'])
+                vsh = _curve(log, 'VSH') if 'VSH' in curves else np.empty(0, dtype=np.float32)
+                log['PHIT'] = _phid(
+                    rhob, vsh,
+                    params['rhob_matrix'], params['rhob_fluid'], params['rhob_shale'],
+                    np.empty_like(rhob)
+                )
+            elif 'VSH' in curves:
+                log.formation_porosity(
+                    rhob_curve=params['rhob_curve'],
+                    rhob_matrix=params['rhob_matrix'],
+                    rhob_fluid=params['rhob_fluid'],
+                    rhob_shale=params['rhob_shale'],
+                    vsh_curve='VSH'
+                )
+            else:
+                log.formation_porosity(
+                    rhob_curve=params['rhob_curve'],
+                    rhob_matrix=params['rhob_matrix'],
+                    rhob_fluid=params['rhob_fluid']
+                )
+            curves.add('PHIT')
+            print(f"  PHIT range: {log['PHIT'].min():.3f} - {log['PHIT'].max():.3f}")
+
+        # 3. Water Saturation
+        if params['rt_curve'] in curves and 'PHIT' in curves:
+            print("\nCalculating water saturation...")
+            if HAS_NUMBA and params['sw_method'] == 'archie':
+                phit = _curve(log, 'PHIT')
+                log['SW'] = _archie(
+                    phit, _curve(log, params['rt_curve']),
+                    params['rw'], params['a'], params['m'], params['n'],
+                    np.empty_like(phit)
+                )
+            else:
+                log.water_saturation(
+                    method=params['sw_method'],
+                    rt_curve=params['rt_curve'],
+                    porosity_curve='PHIT',
+                    rw=params['rw'],
+                    a=params['a'],
+                    m=params['m'],
+                    n=params['n']
+                )
+            curves.add('SW')
+            print(f"  SW range: {log['SW'].min():.3f} - {log['SW'].max():.3f}")
+
+        # 4. Permeability
+        if 'PHIT' in curves and 'SW' in curves:
+            print("\nCalculating permeability...")
+            if HAS_NUMBA and params['perm_method'] == 'timur':
+                phit = _curve(log, 'PHIT')
+                log['PERM'] = _timur(phit, _curve(log, 'SW'), np.empty_like(phit))
+            else:
+                log.permeability(
+                    method=params['perm_method'],
+                    porosity_curve='PHIT',
+                    sw_curve='SW'
+                )
+            curves.add('PERM')
+            print(f"  PERM range: {log['PERM'].min():.3f} - {log['PERM'].max():.1f} mD")
 
     # 5. Pay Flag
-    if all(c in log.keys() for c in ['VSH', 'PHIT', 'SW']):
+    if all(c in curves for c in ['VSH', 'PHIT', 'SW']):
         print("\nCalculating pay zones...")
-        pay = (
-            (log['VSH'] < params['vsh_cutoff']) &
-            (log['PHIT'] > params['phi_cutoff']) &
-            (log['SW'] < params['sw_cutoff'])
-        )
-        log['PAY'] = pay.astype(float)
+        vsh = np.asarray(log['VSH'])
+        phit = np.asarray(log['PHIT'])
+        sw = np.asarray(log['SW'])
+
+        if pay is None:
+            # One boolean buffer, reused as the destination of every comparison
+            pay = np.less(vsh, params['vsh_cutoff'])
+            tmp = np.empty_like(pay)
+            np.logical_and(pay, np.greater(phit, params['phi_cutoff'], out=tmp), out=pay)
+            np.logical_and(pay, np.less(sw, params['sw_cutoff'], out=tmp), out=pay)
+        log['PAY'] = pay.astype(np.uint8)
+        curves.add('PAY')
 
         # Calculate summaries
         depth = log[params['depth_curve']]
-        step = np.median(np.abs(np.diff(depth)))
-        net_pay = np.sum(pay) * step
+        step = _log_step(depth, log)
+        n_pay = np.count_nonzero(pay)
+        net_pay = n_pay * step
         gross = depth.max() - depth.min()
         ntg = net_pay / gross if gross > 0 else 0
 
@@ -167,14 +540,47 @@ def formation_evaluation(las_path: str, params: dict) -> pp.Log:
         print(f"  N/G: {ntg:.2%}")
 
         # Pay zone averages
-        if np.any(pay):
-            print(f"  Avg porosity (pay): {log['PHIT'][pay].mean():.3f}")
-            print(f"  Avg Sw (pay): {log['SW'][pay].mean():.3f}")
-            print(f"  Avg Sh (pay): {1 - log['SW'][pay].mean():.3f}")
+        if n_pay:
+            sw_pay = sw.mean(where=pay)
+            print(f"  Avg porosity (pay): {phit.mean(where=pay):.3f}")
+            print(f"  Avg Sw (pay): {sw_pay:.3f}")
+            print(f"  Avg Sh (pay): {1 - sw_pay:.3f}")
 
     return log
 
 
+def _add_line(ax, x, depth, color, linewidth, label=None):
+    """Draw a curve against depth as a single-path LineCollection."""
+    from matplotlib.collections import LineCollection
+
+    path = np.column_stack([np.asarray(x, dtype=float), depth])
+    ax.add_collection(
+        LineCollection([path], colors=color, linewidths=linewidth, label=label)
+    )
+
+
+def _add_fill(ax, x1, x2, depth, color, alpha, label=None):
+    """
+    Shade between two curves with one PolyCollection polygon.
+
+    Null samples collapse onto the other edge instead of splitting the fill.
+    """
+    from matplotlib.collections import PolyCollection
+
+    x1 = np.broadcast_to(np.asarray(x1, dtype=float), depth.shape)
+    x2 = np.broadcast_to(np.asarray(x2, dtype=float), depth.shape)
+    x1 = np.where(np.isfinite(x1), x1, x2)
+    x2 = np.where(np.isfinite(x2), x2, x1)
+    polygon = np.column_stack([
+        np.concatenate([x1, x2[::-1]]),
+        np.concatenate([depth, depth[::-1]]),
+    ])
+    ax.add_collection(
+        PolyCollection([polygon], facecolors=color, edgecolors='none',
+                       alpha=alpha, label=label)
+    )
+
+
 def create_summary_plot(log, params: dict, output_path: str = None):
     """Create formation evaluation summary plot."""
     try:
@@ -183,19 +589,20 @@ def create_summary_plot(log, params: dict, output_path: str = None):
         print("Warning: matplotlib not installed, skipping plot")
         return
 
-    depth = log[params['depth_curve']]
+    depth = np.asarray(log[params['depth_curve']], dtype=float)
+    curves = set(log.keys())
 
     fig, axes = plt.subplots(1, 5, figsize=(15, 10), sharey=True)
     fig.suptitle('Formation Evaluation Summary', fontsize=14)
 
     # Track 1: GR and Vsh
     ax = axes[0]
-    if params['gr_curve'] in log.keys():
-        ax.plot(log[params['gr_curve']], depth, 'g-', linewidth=0.5, label='GR')
-        ax.fill_betweenx(depth, log[params['gr_curve']], 0, alpha=0.3, color='green')
-    if 'VSH' in log.keys():
+    if params['gr_curve'] in curves:
+        _add_line(ax, log[params['gr_curve']], depth, 'green', 0.5, label='GR')
+        _add_fill(ax, log[params['gr_curve']], 0, depth, 'green', 0.3)
+    if 'VSH' in curves:
         ax2 = ax.twiny()
-        ax2.plot(log['VSH'], depth, 'brown', linewidth=1, label='VSH')
+        _add_line(ax2, log['VSH'], depth, 'brown', 1, label='VSH')
         ax2.set_xlim(0, 1)
         ax2.set_xlabel('VSH (v/v)', color='brown')
     ax.set_xlim(0, 150)
@@ -204,39 +611,41 @@ def create_summary_plot(log, params: dict, output_path: str = None):
 
     # Track 2: Resistivity
     ax = axes[1]
-    if params['rt_curve'] in log.keys():
-        ax.semilogx(log[params['rt_curve']], depth, 'r-', linewidth=0.5)
+    ax.set_xscale('log')
+    if params['rt_curve'] in curves:
+        _add_line(ax, log[params['rt_curve']], depth, 'red', 0.5)
     ax.set_xlim(0.1, 1000)
     ax.set_xlabel('RT (ohm-m)')
 
     # Track 3: Porosity
     ax = axes[2]
-    if params['nphi_curve'] in log.keys():
-        ax.plot(log[params['nphi_curve']], depth, 'b-', linewidth=0.5, label='NPHI')
-    if 'PHIT' in log.keys():
-        ax.plot(log['PHIT'], depth, 'r-', linewidth=1, label='PHIT')
+    if params['nphi_curve'] in curves:
+        _add_line(ax, log[params['nphi_curve']], depth, 'blue', 0.5, label='NPHI')
+    if 'PHIT' in curves:
+        _add_line(ax, log['PHIT'], depth, 'red', 1, label='PHIT')
     ax.set_xlim(0.45, -0.15)
     ax.set_xlabel('Porosity (v/v)')
     ax.legend(loc='upper right')
 
     # Track 4: Saturation
     ax = axes[3]
-    if 'SW' in log.keys():
-        ax.plot(log['SW'], depth, 'b-', linewidth=0.5)
-        ax.fill_betweenx(depth, log['SW'], 1, alpha=0.3, color='green', label='HC')
-        ax.fill_betweenx(depth, 0, log['SW'], alpha=0.3, color='blue', label='Water')
+    if 'SW' in curves:
+        _add_line(ax, log['SW'], depth, 'blue', 0.5)
+        _add_fill(ax, log['SW'], 1, depth, 'green', 0.3, label='HC')
+        _add_fill(ax, 0, log['SW'], depth, 'blue', 0.3, label='Water')
     ax.set_xlim(0, 1)
     ax.set_xlabel('Sw (v/v)')
     ax.legend(loc='upper right')
 
     # Track 5: Pay
     ax = axes[4]
-    if 'PAY' in log.keys():
-        ax.fill_betweenx(depth, log['PAY'], 0, alpha=0.5, color='yellow')
+    if 'PAY' in curves:
+        _add_fill(ax, log['PAY'], 0, depth, 'yellow', 0.5)
     ax.set_xlim(0, 1.5)
     ax.set_xlabel('Pay Flag')
 
-    axes[0].invert_yaxis()
+    # Collections do not autoscale; the shared depth axis is set once
+    axes[0].set_ylim(np.nanmax(depth), np.nanmin(depth))
 
     plt.tight_layout()
 
@@ -247,48 +656,103 @@ def create_summary_plot(log, params: dict, output_path: str = None):
         plt.show()
 
 
+@njit(**_JIT)
+def _pay_stats(columns, pay, n_chunks):
+    """
+    Pay-zone sums, total sums and pay count for several curves in one sweep.
+
+    Returns:
+        float64 array [pay sums..., total sums..., pay count]
+    """
+    n = pay.shape[0]
+    k = len(columns)
+    partial = np.zeros((n_chunks, 2 * k + 1))
+    for c in prange(n_chunks):
+        for i in range(c * n // n_chunks, (c + 1) * n // n_chunks):
+            in_pay = pay[i] > 0.5
+            if in_pay:
+                partial[c, 2 * k] += 1.0
+            for j in range(k):
+                v = columns[j][i]
+                partial[c, k + j] += v
+                if in_pay:
+                    partial[c, j] += v
+    return partial.sum(axis=0)
+
+
+def pay_zone_means(log, names: list) -> tuple:
+    """
+    Pay-zone and whole-log means of the named curves.
+
+    Returns:
+        ({name: pay mean}, {name: total mean}, pay sample count)
+    """
+    pay = np.asarray(log['PAY'])
+    if HAS_NUMBA and names:
+        columns = tuple(_curve(log, name) for name in names)
+        n_chunks = max(1, min(len(pay) // 65536, 256))
+        sums = _pay_stats(columns, pay, n_chunks)
+        n_pay = int(sums[-1])
+        k = len(names)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            pay_means = sums[:k] / n_pay
+            all_means = sums[k:2 * k] / len(pay)
+        return dict(zip(names, pay_means)), dict(zip(names, all_means)), n_pay
+
+    mask = pay > 0.5
+    values = {name: np.asarray(log[name]) for name in names}
+    return (
+        {name: v.mean(where=mask) for name, v in values.items()},
+        {name: v.mean() for name, v in values.items()},
+        int(np.count_nonzero(mask)),
+    )
+
+
 def print_summary_table(log, params: dict):
     """Print formation evaluation summary table."""
     depth = log[params['depth_curve']]
+    curves = set(log.keys())
 
     print("\n" + "=" * 60)
     print("FORMATION EVALUATION SUMMARY")
     print("=" * 60)
 
-    if 'PAY' in log.keys():
-        pay = log['PAY'] > 0.5
-        step = np.median(np.abs(np.diff(depth)))
+    if 'PAY' in curves:
+        names = [c for c in ('PHIT', 'SW', 'VSH', 'PERM') if c in curves]
+        pay_mean, all_mean, n_pay = pay_zone_means(log, names)
+        n_samples = len(log['PAY'])
+        step = _log_step(depth, log)
 
         print(f"\n{'Parameter':<25} {'Pay Zone':<15} {'Total':<15}")
         print("-" * 55)
 
-        if 'PHIT' in log.keys():
+        if 'PHIT' in curves:
             print(f"{'Avg Porosity (v/v)':<25} "
-                  f"{log['PHIT'][pay].mean():.3f} "
-                  f"          {log['PHIT'].mean():.3f}")
+                  f"{pay_mean['PHIT']:.3f} "
+                  f"          {all_mean['PHIT']:.3f}")
 
-        if 'SW' in log.keys():
+        if 'SW' in curves:
             print(f"{'Avg Sw (v/v)':<25} "
-                  f"{log['SW'][pay].mean():.3f} "
-                  f"          {log['SW'].mean():.3f}")
+                  f"{pay_mean['SW']:.3f} "
+                  f"          {all_mean['SW']:.3f}")
             print(f"{'Avg Sh (v/v)':<25} "
-                  f"{(1 - log['SW'][pay]).mean():.3f} "
-                  f"          {(1 - log['SW']).mean():.3f}")
+                  f"{1 - pay_mean['SW']:.3f} "
+                  f"          {1 - all_mean['SW']:.3f}")
 
-        if 'VSH' in log.keys():
+        if 'VSH' in curves:
             print(f"{'Avg Vsh (v/v)':<25} "
-                  f"{log['VSH'][pay].mean():.3f} "
-                  f"          {log['VSH'].mean():.3f}")
+                  f"{pay_mean['VSH']:.3f} "
+                  f"          {all_mean['VSH']:.3f}")
 
-        if 'PERM' in log.keys():
+        if 'PERM' in curves:
             print(f"{'Avg Perm (mD)':<25} "
-                  f"{log['PERM'][pay].mean():.2f} "
-                  f"          {log['PERM'].mean():.2f}")
+                  f"{pay_mean['PERM']:.2f} "
+                  f"          {all_mean['PERM']:.2f}")
 
         print("-" * 55)
-        print(f"{'Net Pay (m)':<25} {np.sum(pay) * step:.1f}")
+        print(f"{'Net Pay (m)':<25} {n_pay * step:.1f}")
         print(f"{'Gross Interval (m)':<25} {depth.max() - depth.min():.1f}")
-        print(f"{'Net-to-Gross':<25} {np.sum(pay) / len(pay):.2%}")
+        print(f"{'Net-to-Gross':<25} {n_pay / n_samples:.2%}")
 
     print("=" * 60)
 
@@ -312,6 +776,11 @@ def main():
         "--plot-output",
         help="Save plot to file (PNG, PDF)"
     )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Read/write .npy curve sidecars next to the LAS file"
+    )
     parser.add_argument(
         "--summary", "-s",
         action="store_true",
@@ -323,7 +792,7 @@ def main():
     params = load_params(args.config)
 
     # Run formation evaluation
-    log = formation_evaluation(args.input, params)
+    log = formation_evaluation(args.input, params, cache=args.cache)
 
     # Save results
     if args.output:
@@ -7,13 +7,136 @@ Usage:
     python create_registry.py <directory> -o registry.txt
     python create_registry.py <directory> --algorithm md5
     python create_registry.py <directory> --recursive
+    python create_registry.py <directory> -o registry.txt --update registry.txt
 """
 
 import argparse
+import fnmatch
+import hashlib
+import json
+import os
+import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 
-import pooch
+
+def file_digest(filepath: Path, algorithm: str) -> str:
+    """
+    Hex digest of a file, matching pooch.file_hash.
+
+    On POSIX, reads 1 MiB chunks from a raw descriptor with sequential
+    read-ahead hints and drops the pages afterwards, so a registry scan does
+    not evict the rest of the page cache. Elsewhere uses hashlib.file_digest
+    (or a chunked loop on Python < 3.11).
+    """
+    if hasattr(os, "posix_fadvise"):
+        h = hashlib.new(algorithm)
+        fd = os.open(filepath, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            while chunk := os.read(fd, 1 << 20):
+                h.update(chunk)
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+        return h.hexdigest()
+
+    with open(filepath, "rb", buffering=0) as fh:
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(fh, algorithm).hexdigest()
+        h = hashlib.new(algorithm)
+        for chunk in iter(lambda: fh.read(1 << 20), b""):
+            h.update(chunk)
+        return h.hexdigest()
+
+
+def _hash_one(filepath: Path, directory: Path, algorithm: str) -> tuple:
+    """
+    Hash one file for the registry.
+
+    Returns:
+        (relative path, hash string or None, error message or None)
+    """
+    rel_path = str(filepath.relative_to(directory))
+    try:
+        file_hash = file_digest(filepath, algorithm)
+    except Exception as e:
+        print(f"Error processing {rel_path}: {e}", file=sys.stderr)
+        return rel_path, None, str(e)
+    print(f"Processed: {rel_path}", file=sys.stderr)
+    return rel_path, f"{algorithm}:{file_hash}", None
+
+
+def _stat_path(registry_path: Path) -> Path:
+    """Sidecar holding (size, mtime_ns) per entry of a registry file."""
+    return registry_path.with_name(f".{registry_path.name}.stat.json")
+
+
+def load_previous(registry_path: str) -> tuple:
+    """
+    Read an existing registry and its stat sidecar.
+
+    Returns:
+        ({name: hash}, {name: [size, mtime_ns]}); empty dicts if missing
+    """
+    registry_path = Path(registry_path)
+    hashes, stats = {}, {}
+    if registry_path.is_file():
+        for line in registry_path.read_text().splitlines():
+            parts = line.split()
+            if len(parts) >= 2 and not line.startswith("#"):
+                hashes[parts[0]] = parts[1]
+    stat_file = _stat_path(registry_path)
+    if stat_file.is_file():
+        try:
+            stats = json.loads(stat_file.read_text())
+        except ValueError:
+            stats = {}
+    return hashes, stats
+
+
+def write_stats(registry_path: str, stats: dict) -> None:
+    """Atomically write the stat sidecar next to a registry file."""
+    stat_file = _stat_path(Path(registry_path))
+    tmp = stat_file.with_name(stat_file.name + ".tmp")
+    tmp.write_text(json.dumps(stats, sort_keys=True))
+    os.replace(tmp, stat_file)
+
+
+def _exclude_regex(patterns: list) -> re.Pattern:
+    """
+    Compile exclude globs into one regex over relative POSIX paths.
+
+    Like Path.match, each glob is matched against the trailing path
+    components, so ``*.pyc`` matches ``sub/a.pyc``.
+    """
+    if not patterns:
+        return re.compile(r"(?!)")
+    return re.compile(
+        "|".join(f"(?:^|.*/){fnmatch.translate(p)}" for p in patterns)
+    )
+
+
+def _walk_files(root: str, recursive: bool, exclude_re: re.Pattern, prefix: str = ""):
+    """
+    Yield (relative POSIX path, os.DirEntry) for files under root.
+
+    Uses os.scandir so file/dir checks come from the cached d_type instead
+    of a stat() per entry. Excluded directories are not descended into.
+    """
+    with os.scandir(root) as it:
+        for entry in it:
+            rel_path = prefix + entry.name
+            if exclude_re.match(rel_path):
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                if recursive:
+                    yield from _walk_files(entry.path, True, exclude_re, rel_path + "/")
+            elif entry.is_file():
+                yield rel_path, entry
 
 
 def create_registry(
@@ -22,6 +145,7 @@ def create_registry(
     algorithm: str = "sha256",
     recursive: bool = False,
     exclude: list = None,
+    update: str = None,
 ) -> dict:
     """
     Generate a registry of file hashes for a directory.
@@ -32,6 +156,8 @@ def create_registry(
         algorithm: Hash algorithm ('sha256' or 'md5')
         recursive: Search subdirectories
         exclude: List of patterns to exclude
+        update: Previous registry file; entries whose size and mtime match
+            its stat sidecar are reused without re-hashing
 
     Returns:
         dict mapping relative file paths to hash strings
@@ -43,47 +169,80 @@ def create_registry(
         raise ValueError(f"Not a directory: {directory}")
 
     # Find all files
-    pattern = "**/*" if recursive else "*"
-    files = [
-        f for f in directory.glob(pattern)
-        if f.is_file() and not any(f.match(ex) for ex in exclude)
-    ]
+    exclude_re = _exclude_regex(exclude)
+    entries = sorted(
+        _walk_files(str(directory), recursive, exclude_re),
+        key=lambda item: item[0].split("/"),
+    )
 
-    if not files:
+    if not entries:
         print(f"No files found in {directory}", file=sys.stderr)
         return {}
 
-    # Generate hashes
-    registry = {}
-    for filepath in sorted(files):
-        rel_path = filepath.relative_to(directory)
-        try:
-            file_hash = pooch.file_hash(str(filepath), alg=algorithm)
-            registry[str(rel_path)] = f"{algorithm}:{file_hash}"
-            print(f"Processed: {rel_path}", file=sys.stderr)
-        except Exception as e:
-            print(f"Error processing {rel_path}: {e}", file=sys.stderr)
+    old_hashes, old_stats = load_previous(update) if update else ({}, {})
+
+    # Reuse hashes of unchanged files; queue the rest for hashing
+    stats, reused, to_hash = {}, {}, []
+    for rel_path, entry in entries:
+        rel_path = str(Path(rel_path))
+        st = entry.stat()
+        stats[rel_path] = [st.st_size, st.st_mtime_ns]
+        old_hash = old_hashes.get(rel_path, "")
+        if (
+            old_stats.get(rel_path) == stats[rel_path]
+            and old_hash.startswith(f"{algorithm}:")
+        ):
+            reused[rel_path] = old_hash
+        else:
+            to_hash.append(Path(entry.path))
+    if update:
+        print(f"Reusing {len(reused)} unchanged hashes", file=sys.stderr)
+
+    # Generate hashes, in parallel across processes for larger sets
+    worker = partial(_hash_one, directory=directory, algorithm=algorithm)
+    if len(to_hash) < 4:
+        results = [worker(f) for f in to_hash]
+    else:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            results = list(executor.map(worker, to_hash, chunksize=8))
+
+    hashed = {
+        rel_path: hash_val
+        for rel_path, hash_val, _ in results
+        if hash_val is not None
+    }
+    registry = {
+        name: reused.get(name) or hashed[name]
+        for name in stats
+        if name in reused or name in hashed
+    }
 
-    # Output registry
-    lines = [f"{name} {hash_val}" for name, hash_val in registry.items()]
-    content = "\n".join(lines) + "\n"
+    # Output registry, encoded once into a single bytes buffer
+    buf = bytearray()
+    for name, hash_val in registry.items():
+        buf += f"{name} {hash_val}\n".encode()
 
     if output:
-        Path(output).write_text(content)
+        with open(output, "wb") as f:
+            f.write(buf)
         print(f"\nRegistry written to: {output}", file=sys.stderr)
     else:
-        print(content)
+        sys.stdout.flush()
+        sys.stdout.buffer.write(buf + b"\n")
+        sys.stdout.buffer.flush()
+
+    # The sidecar must describe the registry file it sits next to, so it is
+    # only written alongside a registry that was actually written
+    if output:
+        write_stats(output, {n: stats[n] for n in registry})
 
     return registry
 
 
 def print_python_dict(registry: dict) -> None:
     """Print registry as Python dict for copy/paste."""
-    print("\n# Python dict format:")
-    print("registry = {")
-    for name, hash_val in registry.items():
-        print(f'    "{name}": "{hash_val}",')
-    print("}")
+    body = "\n".join(f'    "{name}": "{hash_val}",' for name, hash_val in registry.items())
+    sys.stdout.write(f"\n# Python dict format:\nregistry = {{\n{body}\n}}\n")
 
 
 def main():
@@ -112,6 +271,11 @@ def main():
         default=[".git", "__pycache__", "*.pyc", ".DS_Store"],
         help="Patterns to exclude"
     )
+    parser.add_argument(
+        "--update",
+        metavar="REGISTRY",
+        help="Previous registry; skip re-hashing files whose size/mtime are unchanged"
+    )
     parser.add_argument(
         "--python",
         action="store_true",
@@ -127,6 +291,7 @@ def main():
             args.algorithm,
             args.recursive,
             args.exclude,
+            args.update,
         )
 
         if args.python and registry:
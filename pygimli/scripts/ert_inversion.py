@@ -33,10 +33,14 @@ def load_and_validate(filepath: str) -> pg.DataContainer:
 
     # Check for invalid data
     if "rhoa" in data.dataKeys():
-        rhoa = data["rhoa"]
-        invalid = (rhoa <= 0) | ~np.isfinite(rhoa)
-        if np.any(invalid):
-            print(f"  Invalid measurements: {np.sum(invalid)}")
+        rhoa = np.asarray(data["rhoa"])
+        # Valid means 0 < rhoa < inf (NaN fails both); build it in one buffer
+        invalid = np.greater(rhoa, 0)
+        np.logical_and(invalid, np.less(rhoa, np.inf), out=invalid)
+        np.logical_not(invalid, out=invalid)
+        n_invalid = np.count_nonzero(invalid)
+        if n_invalid:
+            print(f"  Invalid measurements: {n_invalid}")
             data.markInvalid(invalid)
             data.removeInvalid()
             print(f"  After removal: {data.size()}")
@@ -153,9 +157,10 @@ def save_results(
     pg.save(mgr.model, str(model_file))
     print(f"Saved model: {model_file}")
 
-    # Save coverage
+    # Save coverage (computed once; reused for the VTK export)
+    coverage = mgr.coverage()
     coverage_file = outpath / "coverage.vector"
-    pg.save(mgr.coverage(), str(coverage_file))
+    pg.save(coverage, str(coverage_file))
     print(f"Saved coverage: {coverage_file}")
 
     # Export VTK
@@ -165,7 +170,7 @@ def save_results(
             str(vtk_file),
             {
                 "resistivity": mgr.model,
-                "coverage": mgr.coverage(),
+                "coverage": coverage,
             },
         )
         print(f"Saved VTK: {vtk_file}.vtk")
@@ -19,6 +19,7 @@ Options:
 
 import argparse
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 import matplotlib.pyplot as plt
@@ -26,13 +27,90 @@ import numpy as np
 import pandas as pd
 
 
-def load_data(filepath: str) -> pd.DataFrame:
-    """Load geochemistry data from CSV."""
-    df = pd.read_csv(filepath)
+# REE elements in order
+REE_COLS = ['La', 'Ce', 'Pr', 'Nd', 'Sm', 'Eu', 'Gd',
+            'Tb', 'Dy', 'Ho', 'Er', 'Tm', 'Yb', 'Lu']
+
+# Common trace element order
+TRACE_COLS = ['Cs', 'Rb', 'Ba', 'Th', 'U', 'Nb', 'Ta', 'K', 'La', 'Ce',
+              'Pb', 'Pr', 'Sr', 'Nd', 'Sm', 'Zr', 'Hf', 'Eu', 'Gd',
+              'Tb', 'Dy', 'Ho', 'Y', 'Er', 'Tm', 'Yb', 'Lu']
+
+TAS_COLS = ['SiO2', 'Na2O', 'K2O']
+
+# Elements to plot against SiO2
+HARKER_COLS = ['TiO2', 'Al2O3', 'FeO', 'Fe2O3', 'MgO', 'CaO', 'Na2O', 'K2O', 'P2O5']
+
+
+def required_columns(plot: str, group_col: str = None,
+                     ternary_cols: list = None) -> set:
+    """Columns any of the requested plots can use."""
+    needed = set()
+    if plot in ['ree', 'all']:
+        needed.update(REE_COLS)
+    if plot in ['spider', 'all']:
+        needed.update(TRACE_COLS)
+    if plot in ['tas', 'all']:
+        needed.update(TAS_COLS)
+    if plot in ['harker', 'all']:
+        needed.update(['SiO2'] + HARKER_COLS)
+    if plot == 'ternary' and ternary_cols:
+        needed.update(ternary_cols)
+    if group_col:
+        needed.add(group_col)
+    return needed
+
+
+def load_data(filepath: str, columns: set = None,
+              required: list = None) -> pd.DataFrame:
+    """
+    Load geochemistry data from CSV.
+
+    Only the given columns are parsed (all if None), using the
+    multithreaded PyArrow parser when available. Columns in `required`
+    are checked against the header before anything is parsed.
+    """
+    usecols = None
+    if columns is not None or required:
+        header = pd.read_csv(filepath, nrows=0).columns
+        missing = [col for col in required or [] if col not in header]
+        if missing:
+            raise ValueError(f"Missing columns: {missing}")
+    if columns is not None:
+        usecols = [col for col in header if col in columns]
+    try:
+        df = pd.read_csv(filepath, engine="pyarrow", usecols=usecols)
+    except (ImportError, ValueError):
+        df = pd.read_csv(filepath, usecols=usecols)
     print(f"Loaded {len(df)} samples with columns: {list(df.columns)}")
     return df
 
 
+def _group_indices(df: pd.DataFrame, group_col: str) -> dict:
+    """
+    Positional row indices per group, in order of first appearance.
+
+    One groupby pass replaces a full equality scan per group; rows with a
+    missing group label are left out, as they matched no group before.
+    """
+    return df.groupby(group_col, sort=False).indices
+
+
+@lru_cache(maxsize=16)
+def reference_composition(norm_name: str):
+    """
+    Normalization reference in ppm, loaded once per name.
+
+    pyrolite re-reads the reference table on every lookup; plots and
+    repeated calls share the cached Composition instead.
+    """
+    from pyrolite.geochem.norm import get_reference_composition
+
+    ref = get_reference_composition(norm_name)
+    ref.set_units('ppm')
+    return ref
+
+
 def plot_ree(df: pd.DataFrame, norm_name: str = "Chondrite_McDonough1995",
              group_col: str = None) -> plt.Figure:
     """
@@ -43,14 +121,8 @@ def plot_ree(df: pd.DataFrame, norm_name: str = "Chondrite_McDonough1995",
         norm_name: Normalization reference name
         group_col: Column name for grouping samples by color
     """
-    from pyrolite.geochem.norm import get_reference_composition
-
-    # REE elements in order
-    ree_cols = ['La', 'Ce', 'Pr', 'Nd', 'Sm', 'Eu', 'Gd',
-                'Tb', 'Dy', 'Ho', 'Er', 'Tm', 'Yb', 'Lu']
-
     # Find available REE columns
-    available = [col for col in ree_cols if col in df.columns]
+    available = [col for col in REE_COLS if col in df.columns]
     if len(available) < 3:
         print(f"Error: Need at least 3 REE columns. Found: {available}")
         return None
@@ -58,7 +130,7 @@ def plot_ree(df: pd.DataFrame, norm_name: str = "Chondrite_McDonough1995",
     print(f"Using REE columns: {available}")
 
     # Get reference and normalize
-    ref = get_reference_composition(norm_name)
+    ref = reference_composition(norm_name)
     df_ree = df[available].copy()
     df_norm = df_ree.pyrochem.normalize_to(ref, units='ppm')
 
@@ -66,12 +138,11 @@ def plot_ree(df: pd.DataFrame, norm_name: str = "Chondrite_McDonough1995",
     fig, ax = plt.subplots(figsize=(10, 6))
 
     if group_col and group_col in df.columns:
-        groups = df[group_col].unique()
+        groups = _group_indices(df, group_col)
         colors = plt.cm.tab10(np.linspace(0, 1, len(groups)))
-        for group, color in zip(groups, colors):
-            mask = df[group_col] == group
-            df_norm[mask].pyroplot.REE(ax=ax, unity_line=True, color=color,
-                                       label=str(group))
+        for (group, idx), color in zip(groups.items(), colors):
+            df_norm.iloc[idx].pyroplot.REE(ax=ax, unity_line=True, color=color,
+                                           label=str(group))
         ax.legend(title=group_col)
     else:
         df_norm.pyroplot.REE(ax=ax, unity_line=True)
@@ -90,15 +161,8 @@ def plot_spider(df: pd.DataFrame, norm_name: str = "PM_McDonough1995",
         norm_name: Normalization reference name
         group_col: Column name for grouping samples by color
     """
-    from pyrolite.geochem.norm import get_reference_composition
-
-    # Common trace element order
-    trace_cols = ['Cs', 'Rb', 'Ba', 'Th', 'U', 'Nb', 'Ta', 'K', 'La', 'Ce',
-                  'Pb', 'Pr', 'Sr', 'Nd', 'Sm', 'Zr', 'Hf', 'Eu', 'Gd',
-                  'Tb', 'Dy', 'Ho', 'Y', 'Er', 'Tm', 'Yb', 'Lu']
-
     # Find available columns
-    available = [col for col in trace_cols if col in df.columns]
+    available = [col for col in TRACE_COLS if col in df.columns]
     if len(available) < 5:
         print(f"Error: Need at least 5 trace element columns. Found: {available}")
         return None
@@ -106,7 +170,7 @@ def plot_spider(df: pd.DataFrame, norm_name: str = "PM_McDonough1995",
     print(f"Using trace element columns: {available}")
 
     # Get reference and normalize
-    ref = get_reference_composition(norm_name)
+    ref = reference_composition(norm_name)
     df_trace = df[available].copy()
     df_norm = df_trace.pyrochem.normalize_to(ref, units='ppm')
 
@@ -114,12 +178,11 @@ def plot_spider(df: pd.DataFrame, norm_name: str = "PM_McDonough1995",
     fig, ax = plt.subplots(figsize=(12, 6))
 
     if group_col and group_col in df.columns:
-        groups = df[group_col].unique()
+        groups = _group_indices(df, group_col)
         colors = plt.cm.tab10(np.linspace(0, 1, len(groups)))
-        for group, color in zip(groups, colors):
-            mask = df[group_col] == group
-            df_norm[mask].pyroplot.spider(ax=ax, unity_line=True, color=color,
-                                          label=str(group))
+        for (group, idx), color in zip(groups.items(), colors):
+            df_norm.iloc[idx].pyroplot.spider(ax=ax, unity_line=True, color=color,
+                                              label=str(group))
         ax.legend(title=group_col)
     else:
         df_norm.pyroplot.spider(ax=ax, unity_line=True)
@@ -138,31 +201,30 @@ def plot_tas(df: pd.DataFrame, group_col: str = None) -> plt.Figure:
     """
     from pyrolite.plot.templates import TAS
 
-    required = ['SiO2', 'Na2O', 'K2O']
-    missing = [col for col in required if col not in df.columns]
+    missing = [col for col in TAS_COLS if col not in df.columns]
     if missing:
         print(f"Error: Missing required columns: {missing}")
         return None
 
-    # Calculate total alkalis
-    df_plot = df.copy()
-    df_plot['Na2O_K2O'] = df_plot['Na2O'] + df_plot['K2O']
+    # Calculate total alkalis straight from the columns (no DataFrame copy)
+    silica = df['SiO2'].to_numpy()
+    alkalis = df['Na2O'].to_numpy() + df['K2O'].to_numpy()
 
     # Create TAS diagram
     fig, ax = plt.subplots(figsize=(10, 8))
     ax = TAS(ax=ax)
 
     if group_col and group_col in df.columns:
-        groups = df[group_col].unique()
+        groups = _group_indices(df, group_col)
         colors = plt.cm.tab10(np.linspace(0, 1, len(groups)))
-        for group, color in zip(groups, colors):
-            mask = df_plot[group_col] == group
-            ax.scatter(df_plot.loc[mask, 'SiO2'], df_plot.loc[mask, 'Na2O_K2O'],
-                      c=[color], s=50, label=str(group), alpha=0.7, edgecolors='k')
+        for (group, idx), color in zip(groups.items(), colors):
+            ax.scatter(silica[idx], alkalis[idx],
+                      c=[color], s=50, label=str(group), alpha=0.7, edgecolors='k',
+                      rasterized=True)
         ax.legend(title=group_col)
     else:
-        ax.scatter(df_plot['SiO2'], df_plot['Na2O_K2O'], c='red', s=50,
-                   alpha=0.7, edgecolors='k')
+        ax.scatter(silica, alkalis, c='red', s=50,
+                   alpha=0.7, edgecolors='k', rasterized=True)
 
     ax.set_title('Total Alkali-Silica (TAS) Diagram')
     return fig
@@ -180,9 +242,7 @@ def plot_harker(df: pd.DataFrame, group_col: str = None) -> plt.Figure:
         print("Error: SiO2 column required for Harker diagrams")
         return None
 
-    # Elements to plot against SiO2
-    elements = ['TiO2', 'Al2O3', 'FeO', 'Fe2O3', 'MgO', 'CaO', 'Na2O', 'K2O', 'P2O5']
-    available = [col for col in elements if col in df.columns]
+    available = [col for col in HARKER_COLS if col in df.columns]
 
     if len(available) == 0:
         print("Error: No major oxide columns found for Harker diagrams")
@@ -199,20 +259,27 @@ def plot_harker(df: pd.DataFrame, group_col: str = None) -> plt.Figure:
     else:
         axes = axes.flatten()
 
+    # Group indices are shared by every subplot
+    grouped = group_col and group_col in df.columns
+    if grouped:
+        groups = _group_indices(df, group_col)
+        colors = plt.cm.tab10(np.linspace(0, 1, len(groups)))
+        silica = df['SiO2'].to_numpy()
+
     for i, elem in enumerate(available):
         ax = axes[i]
 
-        if group_col and group_col in df.columns:
-            groups = df[group_col].unique()
-            colors = plt.cm.tab10(np.linspace(0, 1, len(groups)))
-            for group, color in zip(groups, colors):
-                mask = df[group_col] == group
-                ax.scatter(df.loc[mask, 'SiO2'], df.loc[mask, elem],
-                          c=[color], s=30, label=str(group), alpha=0.7)
+        if grouped:
+            values = df[elem].to_numpy()
+            for (group, idx), color in zip(groups.items(), colors):
+                ax.scatter(silica[idx], values[idx],
+                          c=[color], s=30, label=str(group), alpha=0.7,
+                          rasterized=True)
             if i == 0:
                 ax.legend(title=group_col, fontsize=8)
         else:
-            ax.scatter(df['SiO2'], df[elem], c='blue', s=30, alpha=0.7)
+            ax.scatter(df['SiO2'], df[elem], c='blue', s=30, alpha=0.7,
+                       rasterized=True)
 
         ax.set_xlabel('SiO2 (wt%)')
         ax.set_ylabel(f'{elem} (wt%)')
@@ -248,15 +315,16 @@ def plot_ternary(df: pd.DataFrame, cols: list, group_col: str = None) -> plt.Fig
     fig, ax = plt.subplots(figsize=(8, 8))
 
     if group_col and group_col in df.columns:
-        groups = df[group_col].unique()
+        groups = _group_indices(df, group_col)
         colors = plt.cm.tab10(np.linspace(0, 1, len(groups)))
-        for group, color in zip(groups, colors):
-            mask = df[group_col] == group
-            df.loc[mask, cols].pyroplot.scatter(ax=ax, c=[color], s=50,
-                                                 label=str(group), alpha=0.7)
+        for (group, idx), color in zip(groups.items(), colors):
+            df[cols].iloc[idx].pyroplot.scatter(ax=ax, c=[color], s=50,
+                                                label=str(group), alpha=0.7,
+                                                rasterized=True)
         ax.legend(title=group_col)
     else:
-        df[cols].pyroplot.scatter(ax=ax, c='red', s=50, alpha=0.7)
+        df[cols].pyroplot.scatter(ax=ax, c='red', s=50, alpha=0.7,
+                                  rasterized=True)
 
     ax.set_title(f'{cols[0]}-{cols[1]}-{cols[2]} Ternary')
     return fig
@@ -277,12 +345,35 @@ def main():
 
     args = parser.parse_args()
 
+    # Render off-screen when only saving to file
+    if args.output:
+        import matplotlib
+        matplotlib.use('Agg')
+
     # Load data
     if not Path(args.data).exists():
         print(f"Error: File not found: {args.data}")
         sys.exit(1)
 
-    df = load_data(args.data)
+    if args.plot == 'ternary' and not args.cols:
+        print("Error: --cols required for ternary plot (e.g., --cols SiO2,CaO,Na2O)")
+        sys.exit(1)
+
+    ternary_cols = [c.strip() for c in args.cols.split(',')] if args.cols else None
+
+    # Columns named on the command line must exist; plot columns are optional
+    required = list(ternary_cols or []) if args.plot == 'ternary' else []
+    if args.group:
+        required.append(args.group)
+    try:
+        df = load_data(
+            args.data,
+            required_columns(args.plot, args.group, ternary_cols),
+            required=required,
+        )
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
 
     # Import pyrolite after loading data to enable accessors
     import pyrolite  # noqa: F401
@@ -312,11 +403,7 @@ def main():
             plots.append(('harker', fig))
 
     if args.plot == 'ternary':
-        if not args.cols:
-            print("Error: --cols required for ternary plot (e.g., --cols SiO2,CaO,Na2O)")
-            sys.exit(1)
-        cols = [c.strip() for c in args.cols.split(',')]
-        fig = plot_ternary(df, cols, group_col=args.group)
+        fig = plot_ternary(df, ternary_cols, group_col=args.group)
         if fig:
             plots.append(('ternary', fig))
 
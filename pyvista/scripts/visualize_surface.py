@@ -9,10 +9,121 @@ Usage:
 """
 
 import argparse
+import os
+import re
 import sys
 from pathlib import Path
 
+import numpy as np
 import pyvista as pv
+from vtkmodules.vtkCommonCore import vtkSMPTools
+from vtkmodules.vtkFiltersCore import vtkBinnedDecimation
+
+# Cells per output pixel at --resolution 1 (default 1024x768 window); finer
+# geometry than this only adds overdraw in a screenshot
+SCREENSHOT_PIXELS = 1024 * 768
+
+# Binned decimation allocates every bin; cap divisions per axis (~0.5 GB)
+MAX_DECIMATION_DIVISIONS = 512
+
+# Point arrays used for shading and texturing rather than coloring; kept
+# when the reader is limited to one scalar array
+SHADING_ARRAYS = {"Normals", "TCoords", "Texture Coordinates"}
+
+def enable_vtk_threads() -> None:
+    """
+    Run VTK's threaded filters (decimation, surface extraction) on all cores.
+
+    The pip VTK wheels default to the Sequential SMP backend; switch to
+    STDThread unless VTK_SMP_BACKEND_IN_USE already picks one (e.g. TBB).
+    """
+    if "VTK_SMP_BACKEND_IN_USE" not in os.environ:
+        vtkSMPTools.SetBackend("STDThread")
+    vtkSMPTools.Initialize(0)
+
+
+def _active_shading_arrays(filepath: str) -> set:
+    """
+    Names of the active normals and texture-coordinate point arrays.
+
+    Read from the Normals/TCoords attributes of the first <PointData> tag,
+    which XML VTK files write near the top.
+    """
+    with open(filepath, "rb") as f:
+        head = f.read(1 << 16).decode("latin-1")
+    tag = re.search(r"<PointData\b[^>]*>", head)
+    if not tag:
+        return set()
+    return set(re.findall(r'\b(?:Normals|TCoords)="([^"]*)"', tag.group(0)))
+
+
+def read_mesh(filepath: str, scalars: str | None = None) -> tuple:
+    """
+    Read a mesh, loading only the requested scalar array where possible.
+
+    Readers with per-array selection (the XML formats: .vtu, .vtp, .vts, ...)
+    skip every other point/cell array apart from normals and texture
+    coordinates, which shading needs; other formats are read in full.
+
+    Returns:
+        (mesh, names of all arrays in the file)
+    """
+    try:
+        reader = pv.get_reader(filepath)
+    except ValueError:
+        reader = None
+
+    if reader is None or not hasattr(reader, "disable_all_point_arrays"):
+        mesh = pv.read(filepath)
+        return mesh, mesh.array_names
+
+    array_names = reader.point_array_names + reader.cell_array_names
+    if scalars in array_names:
+        reader.disable_all_point_arrays()
+        reader.disable_all_cell_arrays()
+        if scalars in reader.point_array_names:
+            reader.enable_point_array(scalars)
+        else:
+            reader.enable_cell_array(scalars)
+        shading = SHADING_ARRAYS | _active_shading_arrays(filepath)
+        for name in shading.intersection(reader.point_array_names):
+            reader.enable_point_array(name)
+    return reader.read(), array_names
+
+
+def decimate_for_output(mesh, resolution: int = 1, scalars: str | None = None):
+    """
+    Reduce a mesh to roughly one triangle per output pixel.
+
+    Uses binned decimation (vtkBinnedDecimation), which is linear in the
+    cell count and keeps input points, so point arrays survive; decimate_pro
+    on a few million cells costs more than the render it saves. Cell arrays
+    are not carried over, so meshes colored by one are kept as is.
+    """
+    budget = SCREENSHOT_PIXELS * resolution**2
+    if mesh.n_cells <= budget or (scalars and scalars in mesh.cell_data):
+        return mesh
+
+    surface = mesh if isinstance(mesh, pv.PolyData) else mesh.extract_surface()
+    surface = surface.triangulate()
+
+    # A sheet spanning the grid gives ~2 triangles per bin along its longest
+    # axes; bins are dense, so shorter axes get proportionally fewer
+    extent = np.ptp(np.reshape(surface.bounds, (3, 2)), axis=1)
+    n_max = min(int((budget / 2) ** 0.5), MAX_DECIMATION_DIVISIONS)
+    divisions = np.maximum(1, np.ceil(n_max * extent / extent.max())).astype(int)
+
+    binning = vtkBinnedDecimation()
+    binning.SetInputData(surface)
+    binning.AutoAdjustNumberOfDivisionsOff()
+    binning.SetNumberOfDivisions(*divisions.tolist())
+    binning.SetPointGenerationModeToUseInputPoints()
+    binning.ProducePointDataOn()
+    binning.Update()
+    decimated = pv.wrap(binning.GetOutput())
+
+    print(f"  Decimated: {surface.n_cells:,} -> {decimated.n_cells:,} cells")
+    return decimated
 
 
 def visualize_surface(
@@ -25,6 +136,7 @@ def visualize_surface(
     resolution: int = 1,
     view: str = "iso",
     background: str = "white",
+    decimate: bool = True,
 ) -> None:
     """
     Visualize a surface mesh from file.
@@ -39,6 +151,7 @@ def visualize_surface(
         resolution: Screenshot resolution multiplier
         view: Camera view ('iso', 'xy', 'xz', 'yz')
         background: Background color
+        decimate: Decimate large meshes to the screenshot's pixel count
     """
     # Load mesh
     path = Path(filepath)
@@ -46,8 +159,10 @@ def visualize_surface(
         print(f"Error: File not found: {filepath}")
         sys.exit(1)
 
+    enable_vtk_threads()
+
     print(f"Loading: {filepath}")
-    mesh = pv.read(filepath)
+    mesh, array_names = read_mesh(filepath, scalars)
 
     # Print mesh info
     print(f"  Type: {type(mesh).__name__}")
@@ -55,14 +170,19 @@ def visualize_surface(
     print(f"  Cells: {mesh.n_cells:,}")
     print(f"  Bounds: {mesh.bounds}")
 
-    if mesh.array_names:
-        print(f"  Arrays: {mesh.array_names}")
+    if array_names:
+        print(f"  Arrays: {array_names}")
 
     # Validate scalars
-    if scalars and scalars not in mesh.array_names:
-        print(f"Warning: Scalar '{scalars}' not found. Available: {mesh.array_names}")
+    if scalars and scalars not in array_names:
+        print(f"Warning: Scalar '{scalars}' not found. Available: {array_names}")
         scalars = None
 
+    # Edges and see-through surfaces would show the decimated triangles
+    # rather than the mesh itself, so those renders keep every cell
+    if output and decimate and not show_edges and opacity >= 1:
+        mesh = decimate_for_output(mesh, resolution, scalars)
+
     # Create plotter
     off_screen = output is not None
     plotter = pv.Plotter(off_screen=off_screen)
@@ -147,6 +267,11 @@ Examples:
     parser.add_argument(
         "--background", "-b", default="white", help="Background color (default: white)"
     )
+    parser.add_argument(
+        "--no-decimate",
+        action="store_true",
+        help="Render full geometry in screenshots (no decimation)",
+    )
 
     args = parser.parse_args()
 
@@ -160,6 +285,7 @@ Examples:
         resolution=args.resolution,
         view=args.view,
         background=args.background,
+        decimate=not args.no_decimate,
     )
 
 
@@ -10,14 +10,41 @@ Example:
     python variogram_analysis.py samples.csv --x easting --y northing --z porosity
 """
 
+from __future__ import annotations
+
 import argparse
 import json
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import matplotlib.pyplot as plt
 import numpy as np
-import pandas as pd
-import skgstat as skg
+
+# pandas, skgstat and matplotlib are imported where they are used, so --help
+# does not pay for loading them
+if TYPE_CHECKING:
+    import skgstat as skg
+
+MODELS = ["spherical", "exponential", "gaussian", "matern"]
+
+# Above this many points the isotropic variograms use a KD-tree sparse
+# distance matrix limited to the maximum lag instead of all N^2/2 pairs,
+# provided the lag keeps at most SPARSE_PAIR_FRACTION of them (beyond that
+# the sparse matrix is slower than the dense one)
+LARGE_N = 5000
+SPARSE_PAIR_FRACTION = 0.25
+
+# Points sampled to estimate the maximum lag and pair fraction
+MAXLAG_SAMPLE = 2000
+
+# Fewer points than this leave too few pairs per azimuthal bin for the
+# directional variograms to mean anything
+MIN_DIRECTIONAL_N = 100
+
+# Per-process sweep state: the data arrive once through the pool initializer
+# and each worker keeps the variograms it builds between tasks
+_POOL_DATA = {}
 
 
 def load_data(filepath: str, x_col: str, y_col: str, z_col: str) -> tuple:
@@ -27,31 +54,195 @@ def load_data(filepath: str, x_col: str, y_col: str, z_col: str) -> tuple:
     Returns:
         tuple: (coordinates array, values array)
     """
-    df = pd.read_csv(filepath)
+    import pandas as pd
 
-    # Validate columns exist
+    # Validate columns exist against the header alone
+    columns = list(pd.read_csv(filepath, nrows=0).columns)
     for col in [x_col, y_col, z_col]:
-        if col not in df.columns:
-            raise ValueError(f"Column '{col}' not found. Available: {list(df.columns)}")
+        if col not in columns:
+            raise ValueError(f"Column '{col}' not found. Available: {columns}")
 
-    # Remove rows with missing values
-    df = df[[x_col, y_col, z_col]].dropna()
+    # Parse only the three columns used, straight to float64; coordinates
+    # stay in double precision, as float32 cannot resolve metres at
+    # projected (e.g. UTM) magnitudes
+    df = pd.read_csv(
+        filepath, usecols=[x_col, y_col, z_col], dtype=np.float64
+    ).dropna()
 
-    coords = df[[x_col, y_col]].values
-    values = df[z_col].values
+    coords = df[[x_col, y_col]].to_numpy()
+    values = df[z_col].to_numpy()
 
     return coords, values
 
 
+def sparse_lag_cutoff(coords: np.ndarray, maxlag, seed: int = 42) -> float | None:
+    """
+    Maximum lag distance for a KD-tree sparse distance matrix.
+
+    The lag and the share of pairs it keeps are estimated from a random
+    subset of MAXLAG_SAMPLE points; a fraction below 1 is taken of the
+    exact maximum distance, found between convex hull vertices.
+
+    Returns:
+        float: Absolute maximum lag, or None if a dense matrix is preferable
+    """
+    from scipy.spatial import ConvexHull
+    from scipy.spatial.distance import pdist
+
+    if maxlag is None:
+        return None
+
+    rng = np.random.default_rng(seed)
+    n = min(len(coords), MAXLAG_SAMPLE)
+    dists = pdist(coords[rng.choice(len(coords), n, replace=False)])
+
+    if maxlag == "median":
+        cutoff = float(np.median(dists))
+    elif maxlag == "mean":
+        cutoff = float(np.mean(dists))
+    elif isinstance(maxlag, str):
+        raise ValueError(f"Unknown maxlag setting: {maxlag}")
+    elif maxlag < 1:
+        hull = coords[ConvexHull(coords).vertices]
+        cutoff = float(maxlag * pdist(hull).max())
+    else:
+        cutoff = float(maxlag)
+
+    if np.mean(dists <= cutoff) > SPARSE_PAIR_FRACTION:
+        return None
+    return cutoff
+
+
+def _init_worker(
+    coords: np.ndarray | skg.MetricSpace,
+    values: np.ndarray,
+    max_dist: float = None,
+) -> None:
+    """Stash the sweep data in this process so tasks are not re-pickled."""
+    _POOL_DATA.clear()
+    _POOL_DATA["coords"] = coords
+    _POOL_DATA["values"] = values
+    _POOL_DATA["max_dist"] = max_dist
+    _POOL_DATA["variograms"] = {}
+
+
+def _shared_variogram(kind: str, **kwargs) -> skg.Variogram:
+    """Return this process's Variogram for one sweep, building it on first use."""
+    import skgstat as skg
+
+    key = (kind, tuple(sorted(kwargs.items())))
+    cache = _POOL_DATA["variograms"]
+    if key not in cache:
+        coords = _POOL_DATA["coords"]
+        if not isinstance(coords, skg.MetricSpace):
+            # Pairwise distances are shared by every variogram in this process
+            coords = _POOL_DATA["coords"] = skg.MetricSpace(
+                coords.copy(), max_dist=_POOL_DATA["max_dist"]
+            )
+        cache[key] = skg.Variogram(
+            coords, _POOL_DATA["values"], model="spherical", **kwargs
+        )
+    return cache[key]
+
+
+def fit_one(kind: str, arg) -> dict:
+    """
+    Fit one variogram of a sweep.
+
+    Args:
+        kind: "model", "estimator" or "azimuth"
+        arg: (model name, n_lags, maxlag), estimator name or azimuth
+
+    Returns:
+        dict: Fitted parameters, or an "error" message if the fit failed
+    """
+    import skgstat as skg
+
+    try:
+        if kind == "model":
+            name, n_lags, maxlag = arg
+            V = _shared_variogram(kind, n_lags=n_lags, maxlag=maxlag)
+            V.model = name
+            return {
+                "name": name,
+                "range": float(V.parameters[0]),
+                "sill": float(V.parameters[1]),
+                "nugget": float(V.parameters[2]),
+                "rmse": float(V.rmse),
+            }
+        if kind == "estimator":
+            V = _shared_variogram(kind, estimator="matheron")
+            V.estimator = arg
+            return {
+                "estimator": arg,
+                "range": float(V.parameters[0]),
+                "sill": float(V.parameters[1]),
+                "nugget": float(V.parameters[2]),
+                "rmse": float(V.rmse),
+            }
+        # DirectionalVariogram does not accept a MetricSpace. A fresh one per
+        # azimuth: changing the azimuth in place leaves the bins and
+        # experimental values of the first direction behind
+        coords = _POOL_DATA["coords"]
+        coords = getattr(coords, "coords", coords)
+        DV = skg.DirectionalVariogram(
+            coords, _POOL_DATA["values"], azimuth=arg, tolerance=22.5, model="spherical"
+        )
+        return {
+            "azimuth": arg,
+            "range": float(DV.parameters[0]),
+            "sill": float(DV.parameters[1]),
+        }
+    except Exception as e:
+        return {"error": str(e)}
+
+
+def _run_sweep(
+    tasks: list,
+    coords: np.ndarray | skg.MetricSpace,
+    values: np.ndarray,
+    workers: int = None,
+) -> list:
+    """
+    Run fit_one over (kind, arg) tasks, in a process pool when it pays off.
+
+    Returns:
+        list: One result dict per task, in task order
+    """
+    workers = min(workers or os.cpu_count() or 1, len(tasks))
+    if workers <= 1:
+        _init_worker(coords, values)
+        try:
+            return [fit_one(kind, arg) for kind, arg in tasks]
+        finally:
+            _POOL_DATA.clear()
+
+    # Workers rebuild distances from the raw coordinates, which pickle far
+    # smaller than a MetricSpace
+    raw = getattr(coords, "coords", coords)
+    max_dist = getattr(coords, "max_dist", None)
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(raw, values, max_dist),
+    ) as executor:
+        return list(executor.map(fit_one, *zip(*tasks)))
+
+
 def analyze_variogram(
-    coords: np.ndarray,
+    coords: np.ndarray | skg.MetricSpace,
     values: np.ndarray,
     n_lags: int = 15,
     maxlag: str = "median",
+    workers: int = 1,
 ) -> dict:
     """
     Perform comprehensive variogram analysis.
 
+    Runs in-process by default, fitting every model on one variogram built
+    from the caller's distances; each pool worker would rebuild the full
+    distance matrix just for a few cheap fits.
+
     Returns:
         dict: Analysis results with best model and parameters
     """
@@ -67,97 +258,94 @@ def analyze_variogram(
         "best_model": None,
     }
 
-    # Create base variogram
-    V = skg.Variogram(coords, values, n_lags=n_lags, maxlag=maxlag)
-
-    # Compare models
-    models = ["spherical", "exponential", "gaussian", "matern"]
-
-    for model_name in models:
-        try:
-            V.model = model_name
-            model_result = {
-                "name": model_name,
-                "range": float(V.parameters[0]),
-                "sill": float(V.parameters[1]),
-                "nugget": float(V.parameters[2]),
-                "rmse": float(V.rmse),
-            }
+    # Compare models; within a process the experimental variogram is built
+    # once and only the model fit changes between tasks
+    tasks = [("model", (name, n_lags, maxlag)) for name in MODELS]
+    for model_name, model_result in zip(
+        MODELS, _run_sweep(tasks, coords, values, workers)
+    ):
+        if "error" in model_result:
+            print(f"Warning: {model_name} model failed: {model_result['error']}")
+        else:
             results["models"].append(model_result)
-        except Exception as e:
-            print(f"Warning: {model_name} model failed: {e}")
 
     # Find best model by RMSE
+    best_model = "spherical"
     if results["models"]:
-        best = min(results["models"], key=lambda x: x["rmse"])
-        results["best_model"] = best["name"]
+        rmses = np.array([m["rmse"] for m in results["models"]])
+        best = results["models"][int(np.argmin(rmses))]
+        results["best_model"] = best_model = best["name"]
+
+    # Variogram with the best model for plotting
+    import skgstat as skg
 
-        # Set variogram to best model
-        V.model = best["name"]
+    V = skg.Variogram(coords, values, n_lags=n_lags, maxlag=maxlag, model=best_model)
 
     return results, V
 
 
-def compare_estimators(coords: np.ndarray, values: np.ndarray) -> list:
+def compare_estimators(
+    coords: np.ndarray | skg.MetricSpace, values: np.ndarray, workers: int = 1
+) -> list:
     """
     Compare different variogram estimators.
 
+    Runs in-process by default: skgstat's estimators are already compiled
+    with numba, so one pass each over the shared lag classes is cheaper
+    than having every worker rebuild the pairwise distances.
+
     Returns:
         list: Results for each estimator
     """
     estimators = ["matheron", "cressie", "dowd"]
     results = []
 
-    for est in estimators:
-        try:
-            V = skg.Variogram(coords, values, estimator=est, model="spherical")
-            results.append(
-                {
-                    "estimator": est,
-                    "range": float(V.parameters[0]),
-                    "sill": float(V.parameters[1]),
-                    "nugget": float(V.parameters[2]),
-                    "rmse": float(V.rmse),
-                }
-            )
-        except Exception as e:
-            print(f"Warning: {est} estimator failed: {e}")
+    tasks = [("estimator", est) for est in estimators]
+    for est, result in zip(estimators, _run_sweep(tasks, coords, values, workers)):
+        if "error" in result:
+            print(f"Warning: {est} estimator failed: {result['error']}")
+        else:
+            results.append(result)
 
     return results
 
 
-def check_anisotropy(coords: np.ndarray, values: np.ndarray) -> list:
+def check_anisotropy(
+    coords: np.ndarray | skg.MetricSpace, values: np.ndarray, workers: int = 1
+) -> list:
     """
     Check for spatial anisotropy using directional variograms.
 
+    Runs in-process by default: every azimuth builds its own directional
+    variogram, so a pool would hold one distance matrix per worker.
+
     Returns:
-        list: Range values for different azimuths
+        list: Range values for different azimuths, empty if there are too
+            few points
     """
+    if len(values) < MIN_DIRECTIONAL_N:
+        print(f"Skipping anisotropy check: fewer than {MIN_DIRECTIONAL_N} points")
+        return []
+
     azimuths = [0, 45, 90, 135]
     results = []
 
-    for az in azimuths:
-        try:
-            DV = skg.DirectionalVariogram(
-                coords, values, azimuth=az, tolerance=22.5, model="spherical"
-            )
-            results.append(
-                {
-                    "azimuth": az,
-                    "range": float(DV.parameters[0]),
-                    "sill": float(DV.parameters[1]),
-                }
-            )
-        except Exception as e:
-            print(f"Warning: Directional variogram at {az} failed: {e}")
+    tasks = [("azimuth", az) for az in azimuths]
+    for az, result in zip(azimuths, _run_sweep(tasks, coords, values, workers)):
+        if "error" in result:
+            print(f"Warning: Directional variogram at {az} failed: {result['error']}")
+        else:
+            results.append(result)
 
     return results
 
 
-def plot_variogram(V: skg.Variogram, output_path: str = None) -> None:
+def plot_variogram(V: skg.Variogram, output_path: str = None, dpi: int = 150) -> None:
     """
     Create variogram plot with model fit.
     """
+    import matplotlib.pyplot as plt
+
     fig, ax = plt.subplots(figsize=(10, 6))
 
     # Plot experimental variogram
@@ -193,34 +381,49 @@ def plot_variogram(V: skg.Variogram, output_path: str = None) -> None:
     ax.grid(True, alpha=0.3)
 
     if output_path:
-        plt.savefig(output_path, dpi=150, bbox_inches="tight")
+        plt.savefig(output_path, dpi=dpi, bbox_inches="tight")
         print(f"Saved variogram plot to: {output_path}")
     else:
         plt.show()
 
-    plt.close()
+    plt.close(fig)
 
 
-def plot_model_comparison(coords: np.ndarray, values: np.ndarray, output_path: str = None) -> None:
+def plot_model_comparison(
+    V: skg.Variogram, output_path: str = None, dpi: int = 100
+) -> None:
     """
     Create comparison plot of all variogram models.
+
+    Refits the given variogram with each model and restores its original
+    model afterwards. The 12x10 inch figure is saved at 100 dpi by
+    default; at higher resolutions savefig dominates the run time.
     """
-    models = ["spherical", "exponential", "gaussian", "matern"]
+    import matplotlib.pyplot as plt
+
     fig, axes = plt.subplots(2, 2, figsize=(12, 10))
 
-    V = skg.Variogram(coords, values)
+    # Only the model fit changes between panels, so the experimental
+    # points and the model abscissa are shared
+    original_model = V.model.__name__
+    bins = V.bins.copy()
+    experimental = V.experimental.copy()
+    x_model = np.linspace(0, bins[-1], 100)
 
-    for ax, model_name in zip(axes.flat, models):
+    for ax, model_name in zip(axes.flat, MODELS):
         V.model = model_name
 
         # Plot experimental
-        ax.scatter(V.bins, V.experimental, s=30, c="blue", zorder=3)
+        ax.scatter(bins, experimental, s=30, c="blue", zorder=3)
 
         # Plot model
-        x_model = np.linspace(0, V.bins[-1], 100)
         y_model = V.model(x_model, *V.parameters[:3])
         ax.plot(x_model, y_model, "r-", linewidth=2)
 
+        # Explicit limits spare autoscaling over both artists
+        ax.set_xlim(0, bins[-1] * 1.05)
+        ax.set_ylim(0, max(np.nanmax(experimental), np.nanmax(y_model)) * 1.1)
+
         ax.set_title(f"{model_name.capitalize()} (RMSE: {V.rmse:.4f})")
         ax.set_xlabel("Lag Distance")
         ax.set_ylabel("Semivariance")
@@ -229,12 +432,13 @@ def plot_model_comparison(coords: np.ndarray, values: np.ndarray, output_path: s
     plt.tight_layout()
 
     if output_path:
-        plt.savefig(output_path, dpi=150, bbox_inches="tight")
+        plt.savefig(output_path, dpi=dpi, bbox_inches="tight")
         print(f"Saved model comparison to: {output_path}")
     else:
         plt.show()
 
-    plt.close()
+    plt.close(fig)
+    V.model = original_model
 
 
 def print_report(results: dict, estimator_results: list, anisotropy_results: list) -> None:
@@ -277,8 +481,9 @@ def print_report(results: dict, estimator_results: list, anisotropy_results: lis
         for a in anisotropy_results:
             print(f"{a['azimuth']:>10} {a['range']:>10.2f} {a['sill']:>10.4f}")
 
-        ranges = [a["range"] for a in anisotropy_results]
-        ratio = max(ranges) / min(ranges) if min(ranges) > 0 else float("inf")
+        ranges = np.array([a["range"] for a in anisotropy_results])
+        min_range = ranges.min()
+        ratio = ranges.max() / min_range if min_range > 0 else float("inf")
         print(f"\nAnisotropy ratio: {ratio:.2f}")
         if ratio > 1.5:
             print("Note: Significant anisotropy detected. Consider directional kriging.")
@@ -286,6 +491,22 @@ def print_report(results: dict, estimator_results: list, anisotropy_results: lis
     print("\n" + "=" * 60)
 
 
+def save_json(results: dict, json_path: Path) -> None:
+    """
+    Write results as indented JSON, with orjson when it is installed.
+    """
+    try:
+        import orjson
+    except ImportError:
+        with open(json_path, "w") as f:
+            json.dump(results, f, indent=2)
+        return
+
+    json_path.write_bytes(
+        orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    )
+
+
 def main():
     parser = argparse.ArgumentParser(description="Variogram analysis workflow")
     parser.add_argument("data", help="CSV file with spatial data")
@@ -298,6 +519,14 @@ def main():
     parser.add_argument(
         "--no-plots", action="store_true", help="Skip generating plots"
     )
+    parser.add_argument(
+        "--dpi", type=int, help="Plot resolution (default: 150, comparison 100)"
+    )
+    parser.add_argument(
+        "--workers", "-w", type=int, default=1,
+        help="Processes for the model sweep; each rebuilds the distance "
+        "matrix (default: 1, in-process)"
+    )
     args = parser.parse_args()
 
     # Load data
@@ -305,15 +534,40 @@ def main():
     coords, values = load_data(args.data, args.x, args.y, args.z)
     print(f"Loaded {len(values)} data points")
 
+    import skgstat as skg
+
+    # argparse hands numeric lags over as strings
+    try:
+        maxlag = float(args.maxlag)
+    except ValueError:
+        maxlag = args.maxlag
+
+    # Pairwise distances are computed once and shared by every isotropic
+    # variogram fitted in this process. Large inputs with a short maximum
+    # lag only keep the pairs within it, found with a KD-tree.
+    max_dist = None
+    if len(values) > LARGE_N:
+        max_dist = sparse_lag_cutoff(coords, maxlag)
+        if max_dist is not None:
+            maxlag = max_dist
+            print(f"Large input: pairs limited to lag distance {max_dist:.2f}")
+    space = skg.MetricSpace(coords, max_dist=max_dist)
+
     # Run analysis
     print("Analyzing variogram...")
-    results, V = analyze_variogram(coords, values, args.n_lags, args.maxlag)
+    results, V = analyze_variogram(
+        space, values, args.n_lags, maxlag, workers=args.workers
+    )
 
     print("Comparing estimators...")
-    estimator_results = compare_estimators(coords, values)
+    # The estimator sweep uses skgstat's default maximum lag, which a
+    # distance matrix clipped to the analysis lag would silently cut short
+    estimator_results = compare_estimators(
+        space if max_dist is None else coords, values
+    )
 
     print("Checking anisotropy...")
-    anisotropy_results = check_anisotropy(coords, values)
+    anisotropy_results = check_anisotropy(space, values)
 
     # Print report
     print_report(results, estimator_results, anisotropy_results)
@@ -330,14 +584,19 @@ def main():
             "anisotropy": anisotropy_results,
         }
         json_path = output_dir / "variogram_results.json"
-        with open(json_path, "w") as f:
-            json.dump(full_results, f, indent=2)
+        save_json(full_results, json_path)
         print(f"\nSaved results to: {json_path}")
 
-        # Generate plots
+        # Generate plots from the analysed variogram, without refitting
+        # its experimental variogram; files only, so no GUI backend
         if not args.no_plots:
-            plot_variogram(V, str(output_dir / "variogram.png"))
-            plot_model_comparison(coords, values, str(output_dir / "model_comparison.png"))
+            import matplotlib
+
+            matplotlib.use("Agg", force=True)
+
+            dpi = {"dpi": args.dpi} if args.dpi else {}
+            plot_variogram(V, str(output_dir / "variogram.png"), **dpi)
+            plot_model_comparison(V, str(output_dir / "model_comparison.png"), **dpi)
 
 
 if __name__ == "__main__":
@@ -4,6 +4,9 @@
 import json
 import re
 import sys
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 REQUIRED_FRONTMATTER_FIELDS = [
@@ -13,6 +16,9 @@ MIN_LINES = 150
 MAX_LINES = 500
 MIN_TAGS = 7
 
+# Threads for reading and validating skills concurrently
+MAX_WORKERS = 8
+
 # Directories that are not skills
 SKIP_DIRS = {
     ".claude-plugin", ".git", ".github", "docs", "scripts",
@@ -24,9 +30,14 @@ VALID_WORKFLOW_ROLES = {
     "data-loading", "processing", "analysis", "modelling", "visualization",
 }
 
+# Fenced code block openers/closers; group 1 is the language tag
+CODE_BLOCK_RE = re.compile(r"^```(\w*)$", re.MULTILINE)
+NEWLINE_RE = re.compile(r"\n")
+
 
+@lru_cache(maxsize=None)
 def parse_frontmatter(text):
-    """Extract YAML frontmatter from markdown text."""
+    """Extract YAML frontmatter from markdown text (parsed once per text)."""
     if not text.startswith("---"):
         return None
     parts = text.split("---", 2)
@@ -50,13 +61,12 @@ def find_skill_dirs(root):
     return skill_dirs
 
 
-def validate_skill(skill_dir):
+def validate_skill(skill_dir, text=None):
     """Validate a single skill. Returns list of (level, message) tuples."""
     issues = []
-    skill_md = skill_dir / "SKILL.md"
-    text = skill_md.read_text(encoding="utf-8")
-    lines = text.splitlines()
-    line_count = len(lines)
+    if text is None:
+        text = (skill_dir / "SKILL.md").read_text(encoding="utf-8")
+    line_count = len(text.splitlines())
 
     # YAML frontmatter
     fm = parse_frontmatter(text)
@@ -82,11 +92,13 @@ def validate_skill(skill_dir):
     elif line_count > MAX_LINES:
         issues.append(("ERROR", f"{line_count} lines exceeds maximum {MAX_LINES}"))
 
-    # Code block language tags
-    code_block_pattern = re.compile(r"^```(\w*)$", re.MULTILINE)
-    for match in code_block_pattern.finditer(text):
+    # Code block language tags; line numbers by bisecting newline offsets
+    newlines = None
+    for match in CODE_BLOCK_RE.finditer(text):
         if not match.group(1):
-            line_num = text[:match.start()].count("\n") + 1
+            if newlines is None:
+                newlines = [m.start() for m in NEWLINE_RE.finditer(text)]
+            line_num = bisect_left(newlines, match.start()) + 1
             issues.append(("WARN", f"Code block without language tag at line {line_num}"))
 
     # "When to use" section
@@ -107,6 +119,12 @@ def validate_skill(skill_dir):
     return issues
 
 
+def _read_and_validate(skill_dir):
+    """Read one SKILL.md and validate it. Returns (text, issues)."""
+    text = (skill_dir / "SKILL.md").read_text(encoding="utf-8")
+    return text, validate_skill(skill_dir, text)
+
+
 def validate_marketplace(root, skill_names):
     """Validate marketplace.json references all skills."""
     issues = []
@@ -154,8 +172,14 @@ def main():
     total_errors = 0
     total_warnings = 0
 
-    for skill_dir in skill_dirs:
-        issues = validate_skill(skill_dir)
+    # Skills are validated concurrently; map keeps the results in order so
+    # the report below prints exactly as a serial run would. Each SKILL.md
+    # is read once and shared with the complements check.
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        results = list(executor.map(_read_and_validate, skill_dirs))
+    texts = {d: text for d, (text, _) in zip(skill_dirs, results)}
+
+    for skill_dir, (_, issues) in zip(skill_dirs, results):
         errors = [i for i in issues if i[0] == "ERROR"]
         warnings = [i for i in issues if i[0] == "WARN"]
         total_errors += len(errors)
@@ -172,8 +196,7 @@ def main():
     # Cross-validate complements references
     skill_names = {d.name for d in skill_dirs}
     for skill_dir in skill_dirs:
-        text = (skill_dir / "SKILL.md").read_text(encoding="utf-8")
-        fm = parse_frontmatter(text)
+        fm = parse_frontmatter(texts[skill_dir])
         if fm and "complements" in fm and isinstance(fm["complements"], list):
             for comp in fm["complements"]:
                 if comp not in skill_names:
@@ -22,6 +22,9 @@ import sys
 import numpy as np
 import segyio
 
+# Traces per bulk read when copying a contiguous range (bounds memory use)
+TRACE_CHUNK = 8192
+
 
 def parse_range(range_str: str) -> tuple:
     """Parse a range string like '100:200' into (start, end)."""
@@ -37,6 +40,31 @@ def parse_range(range_str: str) -> tuple:
         raise ValueError(f"Invalid range format: {range_str}")
 
 
+def sample_window(samples: np.ndarray, time_range: tuple = None):
+    """
+    Index selecting the samples inside an inclusive time range.
+
+    Returns:
+        A slice (a view on each trace) for increasing sample times, or a
+        boolean mask when the times are not monotonic
+    """
+    if not time_range:
+        return slice(None)
+    time_start, time_end = time_range
+    if np.all(np.diff(samples) > 0):
+        s0 = None if time_start is None else int(np.searchsorted(samples, time_start))
+        s1 = None if time_end is None else int(
+            np.searchsorted(samples, time_end, side="right")
+        )
+        return slice(s0, s1)
+    mask = np.ones(len(samples), dtype=bool)
+    if time_start is not None:
+        mask &= samples >= time_start
+    if time_end is not None:
+        mask &= samples <= time_end
+    return mask
+
+
 def extract_by_traces(
     src_path: str,
     dst_path: str,
@@ -55,13 +83,9 @@ def extract_by_traces(
         trace_indices = list(range(start, min(end, src.tracecount)))
 
         # Determine sample range
-        if time_range:
-            time_start, time_end = time_range
-            sample_mask = (src.samples >= time_start) & (src.samples <= time_end)
-            new_samples = src.samples[sample_mask]
-        else:
-            sample_mask = np.ones(len(src.samples), dtype=bool)
-            new_samples = src.samples
+        window = sample_window(src.samples, time_range)
+        new_samples = src.samples[window]
+        full_window = isinstance(window, slice) and window == slice(None)
 
         # Create spec
         spec = segyio.spec()
@@ -77,12 +101,23 @@ def extract_by_traces(
             dst.bin = src.bin
             dst.bin[segyio.BinField.Samples] = len(new_samples)
 
-            # Copy traces
-            for i, src_idx in enumerate(trace_indices):
-                trace_data = src.trace[src_idx]
-                dst.trace[i] = trace_data[sample_mask]
-                dst.header[i] = dict(src.header[src_idx])
-                dst.header[i][segyio.TraceField.TRACE_SAMPLE_COUNT] = len(new_samples)
+            # Copy traces in contiguous chunks: one raw read per chunk, and
+            # headers copied as 240-byte buffers rather than field by field
+            n_samples = {segyio.TraceField.TRACE_SAMPLE_COUNT: len(new_samples)}
+            for chunk_start in range(0, len(trace_indices), TRACE_CHUNK):
+                lo = start + chunk_start
+                hi = min(lo + TRACE_CHUNK, start + len(trace_indices))
+                data = src.trace.raw[lo:hi]
+                if not full_window:
+                    data = data[:, window]
+                dst.trace[chunk_start:chunk_start + len(data)] = data
+
+                for dst_header, src_header in zip(
+                    dst.header[chunk_start:chunk_start + len(data)],
+                    src.header[lo:hi],
+                ):
+                    dst_header.buf = src_header.buf
+                    dst_header.update(n_samples)
 
         return len(trace_indices)
 
@@ -107,30 +142,30 @@ def extract_by_geometry(
             print("Warning: No geometry detected. Falling back to trace-based extraction.")
             return extract_by_traces(src_path, dst_path, (0, src.tracecount), time_range)
 
+        # Line numbers are fetched once; selections are array masks
+        ilines = np.asarray(src.ilines)
+        xlines = np.asarray(src.xlines)
+
         # Determine inline subset
+        il_pos = np.arange(len(ilines))
         if inline_range:
-            il_start = inline_range[0] or src.ilines[0]
-            il_end = inline_range[1] or src.ilines[-1] + 1
-            sel_ilines = [il for il in src.ilines if il_start <= il < il_end]
-        else:
-            sel_ilines = list(src.ilines)
+            il_start = inline_range[0] or ilines[0]
+            il_end = inline_range[1] or ilines[-1] + 1
+            il_pos = np.flatnonzero((ilines >= il_start) & (ilines < il_end))
+        sel_ilines = ilines[il_pos].tolist()
 
         # Determine crossline subset
+        xl_pos = np.arange(len(xlines))
         if xline_range:
-            xl_start = xline_range[0] or src.xlines[0]
-            xl_end = xline_range[1] or src.xlines[-1] + 1
-            sel_xlines = [xl for xl in src.xlines if xl_start <= xl < xl_end]
-        else:
-            sel_xlines = list(src.xlines)
+            xl_start = xline_range[0] or xlines[0]
+            xl_end = xline_range[1] or xlines[-1] + 1
+            xl_pos = np.flatnonzero((xlines >= xl_start) & (xlines < xl_end))
+        sel_xlines = xlines[xl_pos].tolist()
 
         # Determine sample range
-        if time_range:
-            time_start, time_end = time_range
-            sample_mask = (src.samples >= time_start) & (src.samples <= time_end)
-            new_samples = src.samples[sample_mask]
-        else:
-            sample_mask = np.ones(len(src.samples), dtype=bool)
-            new_samples = src.samples
+        window = sample_window(src.samples, time_range)
+        new_samples = src.samples[window]
+        full_window = isinstance(window, slice) and window == slice(None)
 
         # Create spec for 3D output
         spec = segyio.spec()
@@ -148,23 +183,41 @@ def extract_by_geometry(
             dst.bin = src.bin
             dst.bin[segyio.BinField.Samples] = len(new_samples)
 
-            # Copy traces
+            # Source trace number of every selected (inline, crossline)
+            # position, one row per inline
+            n_il, n_xl = len(ilines), len(xlines)
+            all_xlines = len(xl_pos) == n_xl
+            if src.sorting == segyio.TraceSortingFormat.INLINE_SORTING:
+                xl_stride, il_stride = 1, n_xl
+            else:
+                xl_stride, il_stride = n_il, 1
+            src_idx = (il_pos[:, None] * il_stride + xl_pos * xl_stride).tolist()
+
+            # Copy one inline at a time: a single read of the whole line,
+            # then sample and crossline selection on the array
+            n_samples = len(new_samples)
             trace_idx = 0
-            for il in sel_ilines:
-                for xl in sel_xlines:
-                    # Get source trace index
-                    src_idx = src.iline.index(il) * len(src.xlines) + src.xline.index(xl)
-
-                    trace_data = src.trace[src_idx]
-                    dst.trace[trace_idx] = trace_data[sample_mask]
-
-                    # Copy header and update geometry
-                    dst.header[trace_idx] = dict(src.header[src_idx])
-                    dst.header[trace_idx][segyio.TraceField.INLINE_3D] = il
-                    dst.header[trace_idx][segyio.TraceField.CROSSLINE_3D] = xl
-                    dst.header[trace_idx][segyio.TraceField.TRACE_SAMPLE_COUNT] = len(new_samples)
-
-                    trace_idx += 1
+            for il, line_idx in zip(sel_ilines, src_idx):
+                # Gathering the crosslines after the sample slice leaves a
+                # contiguous block; full lines and windows pass straight
+                # through without a copy
+                block = src.iline[il]
+                if not full_window:
+                    block = block[:, window]
+                if not all_xlines:
+                    block = block[xl_pos]
+                dst.iline[il] = np.ascontiguousarray(block)
+
+                headers = []
+                for idx, xl in zip(line_idx, sel_xlines):
+                    header = dict(src.header[idx])
+                    header[segyio.TraceField.INLINE_3D] = il
+                    header[segyio.TraceField.CROSSLINE_3D] = xl
+                    header[segyio.TraceField.TRACE_SAMPLE_COUNT] = n_samples
+                    headers.append(header)
+                dst.header[trace_idx:trace_idx + len(headers)] = headers
+
+                trace_idx += len(headers)
 
         return trace_idx
 
@@ -89,23 +89,29 @@ def create_dipole_dipole_survey(
     electrode_x = np.linspace(-survey_length / 2, survey_length / 2, n_electrodes)
     electrode_locs = np.c_[electrode_x, np.zeros(n_electrodes)]
 
+    # All valid (source, n-spacing) pairs at once, in source order: source
+    # i uses electrodes i and i + 1, and its n-th receiver uses i + 1 + n
+    # and i + 2 + n, for n < 8
+    i_idx, n_idx = np.meshgrid(
+        np.arange(n_electrodes - 3), np.arange(1, 8), indexing="ij"
+    )
+    valid = n_idx < n_electrodes - i_idx - 2
+    i_idx, n_idx = i_idx[valid], n_idx[valid]
+    m_locs = electrode_locs[i_idx + 1 + n_idx]
+    n_locs = electrode_locs[i_idx + 2 + n_idx]
+
+    # Receivers of each source are a contiguous run of pairs
+    sources, starts = np.unique(i_idx, return_index=True)
     source_list = []
-    for i in range(n_electrodes - 3):
-        # Current electrodes
-        a_loc = electrode_locs[i]
-        b_loc = electrode_locs[i + 1]
-
-        # Potential electrodes for multiple n-spacings
-        rx_list = []
-        for n in range(1, min(8, n_electrodes - i - 2)):
-            m_loc = electrode_locs[i + 1 + n]
-            n_loc = electrode_locs[i + 2 + n]
-            rx = dc.receivers.Dipole(m_loc.reshape(1, -1), n_loc.reshape(1, -1))
-            rx_list.append(rx)
-
-        if rx_list:
-            src = dc.sources.Dipole(rx_list, a_loc, b_loc)
-            source_list.append(src)
+    for i, m_src, n_src in zip(
+        sources, np.split(m_locs, starts[1:]), np.split(n_locs, starts[1:])
+    ):
+        rx_list = [
+            dc.receivers.Dipole(m_loc[None, :], n_loc[None, :])
+            for m_loc, n_loc in zip(m_src, n_src)
+        ]
+        src = dc.sources.Dipole(rx_list, electrode_locs[i], electrode_locs[i + 1])
+        source_list.append(src)
 
     survey = dc.Survey(source_list)
     print(f"Survey created: {survey.nD} data points from {len(source_list)} sources")
@@ -128,25 +134,25 @@ def create_true_model(mesh: TensorMesh) -> np.ndarray:
         Resistivity model (ohm-m)
     """
     # Background resistivity
-    model = np.ones(mesh.nC) * 100.0  # 100 ohm-m
-
-    # Conductive anomaly (left side)
-    inds_cond = (
-        (mesh.cell_centers[:, 0] > -60)
-        & (mesh.cell_centers[:, 0] < -20)
-        & (mesh.cell_centers[:, 1] > -40)
-        & (mesh.cell_centers[:, 1] < -10)
-    )
-    model[inds_cond] = 10.0  # 10 ohm-m
-
-    # Resistive anomaly (right side)
-    inds_res = (
-        (mesh.cell_centers[:, 0] > 20)
-        & (mesh.cell_centers[:, 0] < 60)
-        & (mesh.cell_centers[:, 1] > -50)
-        & (mesh.cell_centers[:, 1] < -15)
-    )
-    model[inds_res] = 1000.0  # 1000 ohm-m
+    model = np.full(mesh.nC, 100.0)  # 100 ohm-m
+
+    # Cell centres fetched once; each anomaly mask is built in place, one
+    # comparison at a time, rather than through chained temporaries
+    centers = mesh.cell_centers
+    xc, zc = centers[:, 0], centers[:, 1]
+    mask = np.empty(mesh.nC, dtype=bool)
+    tmp = np.empty(mesh.nC, dtype=bool)
+
+    # Conductive anomaly (left side), then resistive anomaly (right side)
+    for x0, x1, z0, z1, rho in [
+        (-60, -20, -40, -10, 10.0),  # 10 ohm-m
+        (20, 60, -50, -15, 1000.0),  # 1000 ohm-m
+    ]:
+        np.greater(xc, x0, out=mask)
+        mask &= np.less(xc, x1, out=tmp)
+        mask &= np.greater(zc, z0, out=tmp)
+        mask &= np.less(zc, z1, out=tmp)
+        model[mask] = rho
 
     print(f"True model: {model.min():.1f} - {model.max():.1f} ohm-m")
 
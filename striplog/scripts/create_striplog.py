@@ -96,10 +96,11 @@ def create_from_csv(filepath: str) -> Striplog:
     intervals = []
     extra_cols = [c for c in df.columns if c not in ['top', 'base']]
 
-    for _, row in df.iterrows():
-        props = {col: row[col] for col in extra_cols}
+    # Column-wise extraction: one dict per row without a Series per row
+    records = df[extra_cols].to_dict(orient='records')
+    for props, top, base in zip(records, df['top'].tolist(), df['base'].tolist()):
         comp = Component(props)
-        interval = Interval(top=row['top'], base=row['base'], components=[comp])
+        interval = Interval(top=top, base=base, components=[comp])
         intervals.append(interval)
 
     return Striplog(intervals)